@@ -8,8 +8,15 @@ __version__ = "0.1.0"
 __author__ = "Pymba Development Team"
 __license__ = "GPL-3.0"
 
-from .core.engine import PymbaEngine
-from .core.config import PymbaConfig
-
 __all__ = ["PymbaEngine", "PymbaConfig"]
 
+
+def __getattr__(name):
+    """Lazily import heavy core classes on first access (PEP 562)."""
+    if name == "PymbaEngine":
+        from .core.engine import PymbaEngine
+        return PymbaEngine
+    if name == "PymbaConfig":
+        from .core.config import PymbaConfig
+        return PymbaConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
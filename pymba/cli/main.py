@@ -8,18 +8,56 @@ the bash-based emba script from EMBA.
 
 import sys
 import os
-from pathlib import Path
-from typing import Optional, List
-
-# Add pymba to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Any, Dict, Optional, List
 
 from pymba.core.config_manager import ConfigManager, PymbaConfig
-from pymba.core.module_manager import ModuleManager, ModuleCategory
+from pymba.core.module_manager import ModuleManager, ModuleCategory, ModuleStatus
 from pymba.helpers.logging_utils import LogManager
 from pymba.helpers.parameter_parser import parse_parameters
 
 
+_BANNER = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                                                                              ║
+║  ██████╗ ██╗   ██╗███╗   ███╗██████╗  █████╗                               ║
+║  ██╔══██╗╚██╗ ██╔╝████╗ ████║██╔══██╗██╔══██╗                              ║
+║  ██████╔╝ ╚████╔╝ ██╔████╔██║██████╔╝███████║                              ║
+║  ██╔═══╝   ╚██╔╝  ██║╚██╔╝██║██╔══██╗██╔══██║                              ║
+║  ██║        ██║   ██║ ╚═╝ ██║██████╔╝██║  ██║                              ║
+║  ╚═╝        ╚═╝   ╚═╝     ╚═╝╚═════╝ ╚═╝  ╚═╝                              ║
+║                                                                              ║
+║  Python Firmware Security Analyzer                                          ║
+║  A Python port of EMBA (Embedded Linux Analyzer)                            ║
+║                                                                              ║
+║  Version: 0.1.0                                                             ║
+║  Author: Pymba Development Team                                             ║
+║                                                                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+_BANNER_BYTES = (_BANNER + "\n").encode("utf-8")
+
+# Parser used by _show_help, built on first use
+_HELP_PARSER = None
+
+# Per-module result messages
+_MODULE_COMPLETED = "Module {name} completed successfully".format
+_MODULE_FAILED = "Module {name} failed: {error}".format
+_MODULE_STATUS = "Module {name} status: {status}".format
+
+
+def _assign_fields(obj: Any, values: Dict[str, Any]):
+    """Assign attributes in one dict update, or one by one on slotted objects."""
+    attrs = getattr(obj, '__dict__', None)
+    if attrs is not None:
+        attrs.update(values)
+        return
+    for key, value in values.items():
+        setattr(obj, key, value)
+
+
 class PymbaCLI:
     """Main CLI class for Pymba."""
     
@@ -28,6 +66,15 @@ class PymbaCLI:
         self.log_manager = None
         self.module_manager = None
         self.args = None
+        
+        # Special commands as (argument, handler, return value); a return
+        # value of None means the handler's own result is returned
+        self._special_commands = (
+            ('banner', self._show_banner, True),
+            ('only_dep', self._run_dependency_check, None),
+            ('version', self._show_version, True),
+            ('help', self._show_help, True)
+        )
     
     def run(self, args: Optional[List[str]] = None) -> int:
         """Main entry point for Pymba CLI."""
@@ -82,49 +129,25 @@ class PymbaCLI:
     
     def _handle_special_commands(self) -> bool:
         """Handle special commands that don't require full initialization."""
+        get = self.args.get
         
-        # Show banner
-        if self.args.get('banner'):
-            self._show_banner()
-            return True
-        
-        # Dependency check
-        if self.args.get('only_dep'):
-            return self._run_dependency_check()
-        
-        # Version information
-        if self.args.get('version'):
-            self._show_version()
-            return True
-        
-        # Help
-        if self.args.get('help'):
-            self._show_help()
-            return True
+        for key, handler, handled in self._special_commands:
+            if get(key):
+                result = handler()
+                return handled if handled is not None else result
         
         return False
     
     def _show_banner(self):
         """Show Pymba banner."""
-        banner = """
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                                                                              ║
-║  ██████╗ ██╗   ██╗███╗   ███╗██████╗  █████╗                               ║
-║  ██╔══██╗╚██╗ ██╔╝████╗ ████║██╔══██╗██╔══██╗                              ║
-║  ██████╔╝ ╚████╔╝ ██╔████╔██║██████╔╝███████║                              ║
-║  ██╔═══╝   ╚██╔╝  ██║╚██╔╝██║██╔══██╗██╔══██║                              ║
-║  ██║        ██║   ██║ ╚═╝ ██║██████╔╝██║  ██║                              ║
-║  ╚═╝        ╚═╝   ╚═╝     ╚═╝╚═════╝ ╚═╝  ╚═╝                              ║
-║                                                                              ║
-║  Python Firmware Security Analyzer                                          ║
-║  A Python port of EMBA (Embedded Linux Analyzer)                            ║
-║                                                                              ║
-║  Version: 0.1.0                                                             ║
-║  Author: Pymba Development Team                                             ║
-║                                                                              ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-"""
-        print(banner)
+        try:
+            # Flush pending text output first to keep ordering intact
+            sys.stdout.flush()
+            sys.stdout.buffer.write(_BANNER_BYTES)
+            sys.stdout.buffer.flush()
+        except AttributeError:
+            # stdout replaced by a text-only stream
+            print(_BANNER)
     
     def _run_dependency_check(self) -> bool:
         """Run dependency check."""
@@ -171,9 +194,11 @@ class PymbaCLI:
     
     def _show_help(self):
         """Show help information."""
-        from pymba.helpers.parameter_parser import ParameterParser
-        parser = ParameterParser()
-        parser.print_help()
+        global _HELP_PARSER
+        if _HELP_PARSER is None:
+            from pymba.helpers.parameter_parser import ParameterParser
+            _HELP_PARSER = ParameterParser()
+        _HELP_PARSER.print_help()
     
     def _validate_configuration(self) -> bool:
         """Validate configuration and setup."""
@@ -183,13 +208,21 @@ class PymbaCLI:
         # Update configuration from command line arguments
         self._update_config_from_args()
         
-        # Validate configuration
-        issues = self.config_manager.validate_config()
-        if issues:
-            self.log_manager.print_error("Configuration validation failed:")
-            for issue in issues:
-                self.log_manager.print_error(f"  - {issue}")
-            return False
+        # Validate configuration (skipped when this exact config passed before)
+        digest = self._config_digest(self.config_manager.config)
+        validated_file = self._cache_file('validated.hash')
+        if self.args.get('force_revalidate') or not self._is_validated(digest, validated_file):
+            issues = self.config_manager.validate_config()
+            if issues:
+                self.log_manager.print_error("Configuration validation failed:")
+                for issue in issues:
+                    self.log_manager.print_error(f"  - {issue}")
+                return False
+            
+            if digest:
+                self._write_cache_file(validated_file, digest.encode())
+        else:
+            self.log_manager.print_debug("Configuration unchanged since last validation")
         
         # Create necessary directories
         self._create_directories()
@@ -199,52 +232,73 @@ class PymbaCLI:
         
         return True
     
+    def _config_digest(self, config: PymbaConfig) -> Optional[str]:
+        """Digest the configuration together with the firmware file's stat."""
+        try:
+            st = os.stat(config.firmware_path)
+        except (OSError, TypeError, ValueError):
+            # Missing firmware is never cached; validation reports it
+            return None
+        
+        payload = repr((sorted(asdict(config).items()), st.st_mtime_ns, st.st_size))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _is_validated(self, digest: Optional[str], validated_file: str) -> bool:
+        """Check whether the given config digest was validated before."""
+        if not digest:
+            return False
+        try:
+            with open(validated_file, 'r') as f:
+                return f.read().strip() == digest
+        except OSError:
+            return False
+    
     def _update_config_from_args(self):
         """Update configuration from command line arguments."""
-        config = self.config_manager.config
-        
-        # Core paths
-        if self.args.get('firmware'):
-            config.firmware_path = self.args['firmware']
-        if self.args.get('log_dir'):
-            config.log_dir = self.args['log_dir']
-        
-        # Analysis settings
-        config.verbose = self.args.get('verbose', False)
-        config.debug = self.args.get('debug', False)
-        config.quiet = self.args.get('quiet', False)
-        config.force = self.args.get('force', False)
+        get = self.args.get
+        
+        updates = {
+            # Analysis settings
+            'verbose': get('verbose', False),
+            'debug': get('debug', False),
+            'quiet': get('quiet', False),
+            'force': get('force', False),
+            
+            # Module execution
+            'max_parallel_modules': get('threads', 4),
+            'use_multiprocessing': get('use_multiprocessing', False),
+            'module_cache_enabled': not get('disable_module_cache', False),
+            
+            # Output formats
+            'generate_html': get('html', False),
+            'generate_json': get('json', False),
+            'generate_csv': get('csv', False),
+            
+            # Security settings
+            'enable_emulation': get('qemulation', False),
+            'enable_system_emulation': get('full_emulation', False),
+            
+            # Docker settings
+            'use_docker': get('use_docker', True),
+        }
         
-        # Module execution
-        config.max_parallel_modules = self.args.get('threads', 4)
-        config.use_multiprocessing = self.args.get('use_multiprocessing', False)
+        # Core paths, exclusions and firmware metadata only override when given
+        optional = {
+            'firmware_path': get('firmware'),
+            'log_dir': get('log_dir'),
+            'exclude_paths': get('exclude_paths'),
+            'firmware_vendor': get('vendor'),
+            'firmware_version': get('version'),
+        }
+        updates.update((key, value) for key, value in optional.items() if value)
         
         # Architecture
-        if self.args.get('arch'):
-            config.target_architecture = self.args['arch']
-            config.force_architecture = self.args.get('arch_check', 1) == 0
-        
-        # Exclusions
-        if self.args.get('exclude_paths'):
-            config.exclude_paths = self.args['exclude_paths']
-        
-        # Output formats
-        config.generate_html = self.args.get('html', False)
-        config.generate_json = self.args.get('json', False)
-        config.generate_csv = self.args.get('csv', False)
-        
-        # Security settings
-        config.enable_emulation = self.args.get('qemulation', False)
-        config.enable_system_emulation = self.args.get('full_emulation', False)
-        
-        # Docker settings
-        config.use_docker = self.args.get('use_docker', True)
-        
-        # Firmware metadata
-        if self.args.get('vendor'):
-            config.firmware_vendor = self.args['vendor']
-        if self.args.get('version'):
-            config.firmware_version = self.args['version']
+        arch = get('arch')
+        if arch:
+            updates['target_architecture'] = arch.lower()
+            updates['force_architecture'] = get('arch_check', 1) == 0
+        
+        _assign_fields(self.config_manager.config, updates)
     
     def _create_directories(self):
         """Create necessary directories."""
@@ -256,10 +310,12 @@ class PymbaCLI:
             config.temp_dir
         ]
         
-        for directory in directories:
-            if directory:
-                Path(directory).mkdir(parents=True, exist_ok=True)
-                self.log_manager.print_debug(f"Created directory: {directory}")
+        # log_dir, output_dir and temp_dir often coincide; visit each once
+        for directory in dict.fromkeys(d for d in directories if d):
+            if os.path.isdir(directory):
+                continue
+            os.makedirs(directory, exist_ok=True)
+            self.log_manager.print_debug(f"Created directory: {directory}")
     
     def _run_analysis(self) -> int:
         """Run the main analysis."""
@@ -275,6 +331,7 @@ class PymbaCLI:
             if not self.config_manager.load_scan_profile(profile_path):
                 self.log_manager.print_error(f"Failed to load scan profile: {profile_path}")
                 return 1
+            self.module_manager.refresh_config()
         
         # Determine modules to run
         modules_to_run = self._determine_modules_to_run()
@@ -297,16 +354,33 @@ class PymbaCLI:
             else:
                 sequential_modules.append(module_name)
         
-        # Execute sequential modules first
-        if sequential_modules:
-            self.log_manager.print_info(f"Running {len(sequential_modules)} sequential modules...")
-            results = self.module_manager.execute_module_sequence(sequential_modules)
-            self._log_module_results(results)
+        # Parallel modules that (transitively) depend on a sequential module
+        # have to wait; all others run alongside the sequential ones
+        early_modules, deferred_modules = self._split_parallel_modules(
+            sequential_modules, parallel_modules
+        )
         
-        # Execute parallel modules
-        if parallel_modules:
-            self.log_manager.print_info(f"Running {len(parallel_modules)} parallel modules...")
-            results = self.module_manager.execute_modules_parallel(parallel_modules)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            parallel_future = None
+            if early_modules:
+                self.log_manager.print_info(f"Running {len(early_modules)} parallel modules...")
+                parallel_future = executor.submit(
+                    self.module_manager.execute_modules_parallel, early_modules
+                )
+            
+            # Execute sequential modules on the main thread
+            if sequential_modules:
+                self.log_manager.print_info(f"Running {len(sequential_modules)} sequential modules...")
+                results = self.module_manager.execute_module_sequence(sequential_modules)
+                self._log_module_results(results)
+            
+            if parallel_future:
+                self._log_module_results(parallel_future.result())
+        
+        # Execute parallel modules that depend on the sequential phase
+        if deferred_modules:
+            self.log_manager.print_info(f"Running {len(deferred_modules)} dependent parallel modules...")
+            results = self.module_manager.execute_modules_parallel(deferred_modules)
             self._log_module_results(results)
         
         # Generate reports
@@ -317,22 +391,64 @@ class PymbaCLI:
         
         return 0
     
+    def _split_parallel_modules(self, sequential_modules: List[str],
+                                parallel_modules: List[str]) -> tuple:
+        """Split parallel modules into (independent, dependent on sequential ones)."""
+        blocked = set(sequential_modules)
+        deferred = set()
+        
+        # Propagate until no further parallel module picks up a blocked dependency
+        changed = True
+        while changed:
+            changed = False
+            for module_name in parallel_modules:
+                if module_name in deferred:
+                    continue
+                module_info = self.module_manager.get_module_info(module_name)
+                if module_info and any(dep in blocked for dep in module_info.dependencies):
+                    deferred.add(module_name)
+                    blocked.add(module_name)
+                    changed = True
+        
+        early = [name for name in parallel_modules if name not in deferred]
+        late = [name for name in parallel_modules if name in deferred]
+        return early, late
+    
+    def _cache_file(self, filename: str) -> str:
+        """Get the path of a file in the pymba cache directory."""
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+        return os.path.join(cache_home, 'pymba', filename)
+    
+    def _write_cache_file(self, cache_file: str, data: bytes):
+        """Atomically replace a cache file with the given data."""
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            temp_file = cache_file + '.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            self.log_manager.print_debug(f"Failed to write cache file {cache_file}: {e}")
+    
     def _determine_modules_to_run(self) -> List[str]:
         """Determine which modules to run based on configuration."""
-        # Get all available modules
-        all_modules = self.module_manager.list_modules()
+        # Get all available modules (ordered list for iteration, set for lookups)
+        all_modules_list = self.module_manager.list_modules()
+        all_modules = set(all_modules_list)
         
         # Filter by specific modules if requested
         if self.args.get('modules'):
             requested_modules = self.args['modules']
             modules_to_run = []
+            category_cache = {}
             
             for module in requested_modules:
                 # Support category selection (e.g., 'p' for all P-modules)
                 if len(module) == 1 and module.upper() in ['P', 'S', 'L', 'F', 'Q', 'D']:
-                    category = ModuleCategory(module.upper())
-                    category_modules = self.module_manager.list_modules(category)
-                    modules_to_run.extend(category_modules)
+                    category = ModuleCategory[module.upper()]
+                    if category not in category_cache:
+                        category_cache[category] = self.module_manager.list_modules(category)
+                    modules_to_run.extend(category_cache[category])
                 else:
                     # Specific module
                     if module in all_modules:
@@ -343,17 +459,22 @@ class PymbaCLI:
             return modules_to_run
         
         # Return all modules if no specific selection
-        return all_modules
+        return all_modules_list
     
     def _log_module_results(self, results: dict):
         """Log module execution results."""
+        print_success = self.log_manager.print_success
+        print_error = self.log_manager.print_error
+        print_warning = self.log_manager.print_warning
+        
         for module_name, result in results.items():
-            if result.status.value == "completed":
-                self.log_manager.print_success(f"Module {module_name} completed successfully")
-            elif result.status.value == "failed":
-                self.log_manager.print_error(f"Module {module_name} failed: {result.error}")
+            status = result.status
+            if status is ModuleStatus.COMPLETED:
+                print_success(_MODULE_COMPLETED(name=module_name))
+            elif status is ModuleStatus.FAILED:
+                print_error(_MODULE_FAILED(name=module_name, error=result.error))
             else:
-                self.log_manager.print_warning(f"Module {module_name} status: {result.status.value}")
+                print_warning(_MODULE_STATUS(name=module_name, status=status.name.lower()))
     
     def _generate_reports(self):
         """Generate output reports."""
@@ -375,14 +496,17 @@ class PymbaCLI:
         """Print execution summary."""
         summary = self.module_manager.get_execution_summary()
         
-        self.log_manager.print_info("Analysis Summary")
-        self.log_manager.print_info("=" * 50)
-        self.log_manager.print_info(f"Total modules: {summary['total']}")
-        self.log_manager.print_info(f"Completed: {summary['completed']}")
-        self.log_manager.print_info(f"Failed: {summary['failed']}")
-        self.log_manager.print_info(f"Skipped: {summary['skipped']}")
-        self.log_manager.print_info(f"Total duration: {summary['total_duration']:.2f}s")
-        self.log_manager.print_info(f"Average duration: {summary['average_duration']:.2f}s")
+        # One print_info call: a single console write and log file append
+        self.log_manager.print_info("\n".join([
+            "Analysis Summary",
+            "=" * 50,
+            f"Total modules: {summary['total']}",
+            f"Completed: {summary['completed']}",
+            f"Failed: {summary['failed']}",
+            f"Skipped: {summary['skipped']}",
+            f"Total duration: {summary['total_duration']:.2f}s",
+            f"Average duration: {summary['average_duration']:.2f}s"
+        ]))
 
 
 def main():
@@ -2,10 +2,21 @@
 Core orchestration and configuration modules for Pymba.
 """
 
-from .engine import PymbaEngine
-from .config import PymbaConfig
-from .module_manager import ModuleManager
-from .logger import PymbaLogger
-
 __all__ = ["PymbaEngine", "PymbaConfig", "ModuleManager", "PymbaLogger"]
 
+
+def __getattr__(name):
+    """Lazily import core classes on first access (PEP 562)."""
+    if name == "PymbaEngine":
+        from .engine import PymbaEngine
+        return PymbaEngine
+    if name == "PymbaConfig":
+        from .config import PymbaConfig
+        return PymbaConfig
+    if name == "ModuleManager":
+        from .module_manager import ModuleManager
+        return ModuleManager
+    if name == "PymbaLogger":
+        from .logger import PymbaLogger
+        return PymbaLogger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
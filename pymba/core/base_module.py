@@ -9,15 +9,89 @@ inherit from, replacing the bash-based module system from EMBA.
 import os
 import sys
 import time
+import atexit
+import shutil
+import tempfile
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Union
-from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Union
 from dataclasses import dataclass
 
+from ..helpers.dataclass_utils import with_slots
 from ..helpers.logging_utils import LogManager
+from ..helpers.file_utils import (
+    find_files as _find_files,
+    get_file_hash as _get_file_hash,
+    get_file_size as _get_file_size,
+    is_binary_file as _is_binary_file,
+)
+from ..helpers.system_utils import (
+    check_command_exists as _check_command_exists,
+    refresh_path_cache as _refresh_path_cache,
+    run_command as _run_command,
+)
 
+try:
+    # Optional C implementation, faster in the uncontended case
+    from fastrlock.rlock import FastRLock as _Lock
+except ImportError:
+    from threading import RLock as _Lock
 
+
+# RAM-backed scratch space used when no temp_dir is configured
+TMPFS_DIR = "/dev/shm"
+TMPFS_MIN_FREE = 64 * 1024 * 1024
+
+# Module temp dirs this process created on tmpfs, removed at exit. Forked
+# children start with an empty set so they never remove their parent's dirs.
+_TMPFS_DIRS: set = set()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_TMPFS_DIRS.clear)
+
+# Number of print_output() lines a thread buffers before writing them out
+LOG_BATCH_SIZE = 64
+
+# Free space below which create_temp_file() reports low space on the temp
+# filesystem, checked once every TEMP_SPACE_CHECK_INTERVAL calls
+TEMP_LOW_WATERMARK = 128 * 1024 * 1024
+TEMP_SPACE_CHECK_INTERVAL = 32
+
+
+def _terminate_workers(executor: ProcessPoolExecutor):
+    """Kill the worker processes of a process pool."""
+    terminate = getattr(executor, "terminate_workers", None)
+    if terminate is not None:
+        terminate()
+        return
+    for process in list((getattr(executor, "_processes", None) or {}).values()):
+        process.terminate()
+
+
+def cleanup_tmpfs_dirs():
+    """Remove the tmpfs module temp dirs created by this process."""
+    while _TMPFS_DIRS:
+        shutil.rmtree(_TMPFS_DIRS.pop(), ignore_errors=True)
+
+
+atexit.register(cleanup_tmpfs_dirs)
+
+
+def _tmpfs_available() -> bool:
+    """Check whether the tmpfs scratch directory is usable."""
+    if not sys.platform.startswith('linux') or not os.access(TMPFS_DIR, os.W_OK):
+        return False
+    try:
+        st = os.statvfs(TMPFS_DIR)
+    except OSError:
+        return False
+    return st.f_bavail * st.f_frsize >= TMPFS_MIN_FREE
+
+
+@with_slots
 @dataclass
 class ModuleConfig:
     """Configuration for a module."""
@@ -49,14 +123,30 @@ class BaseModule(ABC):
         'enabled': True
     }
     
+    # Command lookups shared by all modules of a run
+    _CMD_EXISTS_CACHE: Dict[str, bool] = {}
+    _CMD_EXISTS_LOCK = _Lock()
+    
+    # MODULE_INFO values resolved once per class, see __init_subclass__
+    _CATEGORY = 'Base'
+    _PRIORITY = 0
+    _CAN_PARALLEL = True
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        info = cls.MODULE_INFO
+        cls._CATEGORY = sys.intern(info.get('category', 'Unknown'))
+        cls._PRIORITY = info.get('priority', 0)
+        cls._CAN_PARALLEL = info.get('can_run_parallel', True)
+    
     def __init__(self, config: ModuleConfig, log_manager: LogManager):
         self.config = config
         self.log_manager = log_manager
         
         # Module identification
         self.module_name = self.__class__.__name__
-        self.category = self.MODULE_INFO.get('category', 'Unknown')
-        self.priority = self.MODULE_INFO.get('priority', 0)
+        self.category = self._CATEGORY
+        self.priority = self._PRIORITY
         
         # Execution state
         self.start_time = None
@@ -64,14 +154,19 @@ class BaseModule(ABC):
         self.duration = 0.0
         self.exit_code = 0
         self.status = "pending"
+        self._stats_cache: Optional[Mapping[str, Any]] = None
+        self._stats_dirty = True
         
-        # Threading
-        self._lock = threading.Lock()
-        self._thread_local = threading.local()
+        # Threading; _thread_local is created on first use, see __getattr__
+        self._lock = _Lock()
+        self._log_buffers: List[list] = []  # per-thread [log_type, lines]
         
         # Module-specific paths
         self.module_log_file = None
-        self.temp_files: List[str] = []
+        self.temp_files: "OrderedDict[str, float]" = OrderedDict()  # path -> creation time
+        self._temp_counter = 0
+        self._temp_file_count = 0
+        self._staging_files: List[str] = []
         
         # Initialize module
         self._initialize_module()
@@ -80,17 +175,35 @@ class BaseModule(ABC):
         """Initialize module-specific settings."""
         # Create module-specific log file
         if self.config.log_dir:
-            log_dir = Path(self.config.log_dir)
-            log_dir.mkdir(parents=True, exist_ok=True)
-            self.module_log_file = log_dir / f"{self.module_name.lower()}.txt"
+            os.makedirs(self.config.log_dir, exist_ok=True)
+            self.module_log_file = os.path.join(self.config.log_dir, f"{self.module_name.lower()}.txt")
         
-        # Set up module-specific temporary directory
+        # Set up module-specific temporary directory; a user supplied
+        # temp_dir is always honored, otherwise prefer tmpfs on Linux
+        self.temp_dir = None
+        self._temp_dir_exists = False
         if self.config.temp_dir:
-            temp_dir = Path(self.config.temp_dir) / self.module_name.lower()
-            temp_dir.mkdir(parents=True, exist_ok=True)
-            self.temp_dir = str(temp_dir)
-        else:
-            self.temp_dir = None
+            self.temp_dir = os.path.join(self.config.temp_dir, self.module_name.lower())
+            os.makedirs(self.temp_dir, exist_ok=True)
+            self._temp_dir_exists = True
+        elif _tmpfs_available():
+            try:
+                self.temp_dir = tempfile.mkdtemp(
+                    prefix=f"pymba-{self.module_name.lower()}-", dir=TMPFS_DIR
+                )
+                self._temp_dir_exists = True
+                _TMPFS_DIRS.add(self.temp_dir)
+            except OSError as e:
+                # tmpfs full or unavailable - fall back to the disk temp dir
+                self.log_manager.print_debug(f"Cannot use {TMPFS_DIR} for temp files: {e}")
+                self.temp_dir = None
+    
+    def __getattr__(self, name: str):
+        """Create the thread-local storage the first time it is needed."""
+        if name == '_thread_local':
+            # setdefault keeps a concurrent first access from replacing it
+            return self.__dict__.setdefault('_thread_local', threading.local())
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
     
     @abstractmethod
     def run(self) -> int:
@@ -113,6 +226,7 @@ class BaseModule(ABC):
     
     def post_run(self) -> None:
         """Post-execution cleanup and finalization."""
+        self._flush_logs(all_threads=True)
         self._cleanup_temp_files()
     
     def module_log_init(self):
@@ -125,71 +239,190 @@ class BaseModule(ABC):
     
     def module_end_log(self, exit_code: int = 0):
         """Finalize module logging."""
+        self._flush_logs()
         self.log_manager.module_end_log(self.module_name, exit_code)
     
     def print_output(self, message: str, log_type: str = "log"):
-        """Print output using the log manager."""
-        self.log_manager.print_output(message, log_type)
+        """Print output using the log manager, batched per thread."""
+        local = self._thread_local
+        buffer = getattr(local, 'log_buffer', None)
+        if buffer is None:
+            buffer = local.log_buffer = [log_type, []]
+            with self._lock:
+                self._log_buffers.append(buffer)
+        elif buffer[0] != log_type:
+            self._flush_logs()
+            buffer[0] = log_type
+        
+        lines = buffer[1]
+        lines.append(message)
+        if len(lines) >= LOG_BATCH_SIZE:
+            self._flush_logs()
+    
+    def _flush_logs(self, all_threads: bool = False):
+        """Write out buffered print_output() lines in a single call."""
+        if all_threads:
+            buffers = self._log_buffers
+        else:
+            buffer = getattr(self._thread_local, 'log_buffer', None)
+            if buffer is None or not buffer[1]:
+                return
+            buffers = (buffer,)
+        
+        with self._lock:
+            for buffer in buffers:
+                log_type, lines = buffer
+                if lines:
+                    buffer[1] = []
+                    self.log_manager.print_output("".join(lines), log_type)
     
     def print_error(self, message: str):
         """Print error message."""
+        self._flush_logs()
         self.log_manager.print_error(message)
     
     def print_warning(self, message: str):
         """Print warning message."""
+        self._flush_logs()
         self.log_manager.print_warning(message)
     
     def print_success(self, message: str):
         """Print success message."""
+        self._flush_logs()
         self.log_manager.print_success(message)
     
     def print_info(self, message: str):
         """Print info message."""
+        self._flush_logs()
         self.log_manager.print_info(message)
     
     def print_debug(self, message: str):
         """Print debug message."""
+        self._flush_logs()
         self.log_manager.print_debug(message)
     
     def sub_module_title(self, title: str):
         """Print sub-module title."""
+        self._flush_logs()
         self.log_manager.sub_module_title(title)
     
     def write_link(self, filepath: str, text: Optional[str] = None):
         """Write file link to log."""
+        self._flush_logs()
         self.log_manager.write_link(filepath, text)
     
     def write_anchor(self, anchor: str, text: str):
         """Write anchor reference to log."""
+        self._flush_logs()
         self.log_manager.write_anchor(anchor, text)
     
     def write_log(self, message: str, log_file: Optional[str] = None):
         """Write message to specific log file."""
+        self._flush_logs()
         self.log_manager.write_log(message, log_file)
     
     def create_temp_file(self, suffix: str = ".tmp") -> str:
         """Create a temporary file for this module."""
         if not self.temp_dir:
-            import tempfile
             temp_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
             temp_path = temp_file.name
             temp_file.close()
-        else:
-            temp_path = os.path.join(self.temp_dir, f"temp_{len(self.temp_files)}{suffix}")
         
-        self.temp_files.append(temp_path)
+        with self._lock:
+            if self.temp_dir:
+                # Removed by the last cleanup, recreated only once it is needed again
+                if not self._temp_dir_exists:
+                    os.makedirs(self.temp_dir, exist_ok=True)
+                    self._temp_dir_exists = True
+                temp_path = os.path.join(self.temp_dir, f"temp_{self._temp_counter}{suffix}")
+            self._temp_counter += 1
+            self.temp_files[temp_path] = time.time()
+            self._temp_file_count += 1
+            self._stats_dirty = True
+            if self._temp_counter % TEMP_SPACE_CHECK_INTERVAL == 0:
+                self._enforce_temp_budget()
         return temp_path
     
+    def create_staging_file(self, final_dir: str, suffix: str = ".tmp") -> str:
+        """
+        Create a temporary file next to its final destination.
+        
+        Unlike create_temp_file(), which may live on tmpfs, the staging file
+        is on the same filesystem as final_dir, so moving it into place with
+        os.replace() is an atomic rename instead of a copy across mounts.
+        Staging files that were not moved away are removed on cleanup.
+        """
+        os.makedirs(final_dir, exist_ok=True)
+        staging_file = tempfile.NamedTemporaryFile(
+            prefix=".staging-", suffix=suffix, dir=final_dir, delete=False
+        )
+        staging_file.close()
+        
+        with self._lock:
+            self._staging_files.append(staging_file.name)
+        return staging_file.name
+    
+    def release_temp_file(self, temp_path: str):
+        """Remove a temporary file as soon as the module no longer needs it."""
+        with self._lock:
+            if self.temp_files.pop(temp_path, None) is None:
+                return
+            self._temp_file_count -= 1
+            self._stats_dirty = True
+        self._remove_temp_file(temp_path)
+    
+    def _remove_temp_file(self, temp_path: str):
+        """Unlink a temporary file, ignoring files that are already gone."""
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.log_manager.print_warning(f"Failed to remove temp file {temp_path}: {e}")
+    
+    def _enforce_temp_budget(self):
+        """Report low free space on the temp filesystem."""
+        # Released files are already gone and the ones still in temp_files
+        # are in use, so there is nothing left to evict here
+        temp_root = self.temp_dir or tempfile.gettempdir()
+        try:
+            st = os.statvfs(temp_root)
+        except (OSError, AttributeError):
+            return
+        free = st.f_bavail * st.f_frsize
+        if free < TEMP_LOW_WATERMARK:
+            self.log_manager.print_debug(
+                f"Low space in {temp_root}: {free // (1024 * 1024)} MB free, "
+                f"{self._temp_file_count} temp files not released yet")
+    
     def _cleanup_temp_files(self):
         """Clean up temporary files created by this module."""
+        # Files inside the module temp dir go away with the directory itself,
+        # only the ones created elsewhere need to be unlinked one by one
+        prefix = os.path.join(self.temp_dir, "") if self.temp_dir else None
         for temp_file in self.temp_files:
+            if prefix and temp_file.startswith(prefix):
+                continue
+            self._remove_temp_file(temp_file)
+        
+        self.temp_files.clear()
+        self._temp_file_count = 0
+        self._stats_dirty = True
+        
+        for staging_file in self._staging_files:
             try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
+                os.unlink(staging_file)
+            except FileNotFoundError:
+                # Already moved into place
+                pass
             except OSError as e:
-                self.log_manager.print_warning(f"Failed to remove temp file {temp_file}: {e}")
+                self.log_manager.print_warning(f"Failed to remove staging file {staging_file}: {e}")
+        self._staging_files.clear()
         
-        self.temp_files.clear()
+        if self.temp_dir:
+            # create_temp_file() recreates it if the module is run again
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self._temp_dir_exists = False
     
     def run_command(self, command: Union[str, List[str]], 
                    cwd: Optional[str] = None,
@@ -207,63 +440,97 @@ class BaseModule(ABC):
         Returns:
             tuple: (exit_code, stdout, stderr)
         """
-        from ..helpers.system_utils import run_command
-        return run_command(command, cwd, timeout, capture_output)
+        return _run_command(command, cwd, timeout, capture_output)
     
     def check_command_exists(self, command: str) -> bool:
         """Check if a command exists in PATH."""
-        from ..helpers.system_utils import check_command_exists
-        return check_command_exists(command)
+        cache = BaseModule._CMD_EXISTS_CACHE
+        try:
+            return cache[command]
+        except KeyError:
+            pass
+        with BaseModule._CMD_EXISTS_LOCK:
+            if command not in cache:
+                cache[command] = _check_command_exists(command)
+            return cache[command]
+    
+    @classmethod
+    def refresh_path_cache(cls):
+        """Forget cached command lookups, e.g. after PATH changed."""
+        with BaseModule._CMD_EXISTS_LOCK:
+            BaseModule._CMD_EXISTS_CACHE.clear()
+        _refresh_path_cache()
     
     def get_file_size(self, filepath: str) -> int:
         """Get file size in bytes."""
-        from ..helpers.file_utils import get_file_size
-        return get_file_size(filepath)
+        return _get_file_size(filepath)
     
     def is_binary_file(self, filepath: str) -> bool:
         """Check if file is binary."""
-        from ..helpers.file_utils import is_binary_file
-        return is_binary_file(filepath)
+        return _is_binary_file(filepath)
     
     def find_files(self, directory: str, pattern: str = "*", recursive: bool = True) -> List[str]:
         """Find files matching pattern."""
-        from ..helpers.file_utils import find_files
-        return find_files(directory, pattern, recursive)
+        return _find_files(directory, pattern, recursive)
     
     def get_file_hash(self, filepath: str, algorithm: str = 'sha256') -> Optional[str]:
         """Calculate file hash."""
-        from ..helpers.file_utils import get_file_hash
-        return get_file_hash(filepath, algorithm)
+        return _get_file_hash(filepath, algorithm)
     
-    def execute_with_timeout(self, func, timeout: int, *args, **kwargs):
-        """Execute a function with timeout."""
-        import signal
-        import threading
-        
-        class TimeoutError(Exception):
-            pass
+    def bulk_hash(self, paths: List[str], algorithm: str = 'sha256') -> Dict[str, Optional[str]]:
+        """Calculate hashes for many files, overlapping reads across threads."""
+        max_workers = max(1, self.config.max_threads)
+        if max_workers == 1 or len(paths) < 2:
+            return {path: _get_file_hash(path, algorithm) for path in paths}
         
-        def timeout_handler(signum, frame):
-            raise TimeoutError("Operation timed out")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            hashes = executor.map(lambda path: _get_file_hash(path, algorithm), paths)
+            return dict(zip(paths, hashes))
+    
+    def execute_with_timeout(self, func, timeout: int, *args, use_process: bool = False, **kwargs):
+        """
+        Execute a function with timeout.
         
-        # Set up timeout
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout)
+        Works from any thread, unlike SIGALRM. A timed out thread cannot be
+        interrupted; it runs on as a daemon thread and does not hold up
+        interpreter exit. use_process=True runs func in a worker process
+        instead, which is killed on timeout (func and its arguments must be
+        picklable).
+        """
+        if use_process:
+            executor = ProcessPoolExecutor(max_workers=1)
+            future = executor.submit(func, *args, **kwargs)
+        else:
+            # ThreadPoolExecutor workers are joined at exit, so a hung func
+            # would block shutdown
+            executor = None
+            future = Future()
+            
+            def target():
+                future.set_running_or_notify_cancel()
+                try:
+                    future.set_result(func(*args, **kwargs))
+                except Exception as e:
+                    future.set_exception(e)
+            
+            threading.Thread(target=target, name=f"pymba-{self.module_name}-timeout", daemon=True).start()
         
         try:
-            result = func(*args, **kwargs)
-            signal.alarm(0)  # Cancel the alarm
-            return result
-        except TimeoutError:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
             self.log_manager.print_error(f"Module {self.module_name} timed out after {timeout} seconds")
+            if executor is not None:
+                _terminate_workers(executor)
             return None
         finally:
-            signal.signal(signal.SIGALRM, old_handler)
+            if executor is not None:
+                executor.shutdown(wait=False)
     
     def run_module(self) -> int:
         """Execute the module with proper setup and cleanup."""
         self.start_time = time.time()
         self.status = "running"
+        self._stats_dirty = True
         
         try:
             # Pre-run validation
@@ -298,23 +565,28 @@ class BaseModule(ABC):
                 pass
         
         finally:
+            self._flush_logs(all_threads=True)
             self.end_time = time.time()
             self.duration = self.end_time - self.start_time
+            self._stats_dirty = True
         
         return self.exit_code
     
-    def get_module_stats(self) -> Dict[str, Any]:
-        """Get module execution statistics."""
-        return {
-            'name': self.module_name,
-            'category': self.category,
-            'status': self.status,
-            'exit_code': self.exit_code,
-            'duration': self.duration,
-            'start_time': self.start_time,
-            'end_time': self.end_time,
-            'temp_files_count': len(self.temp_files)
-        }
+    def get_module_stats(self) -> Mapping[str, Any]:
+        """Get module execution statistics (read-only, rebuilt on state changes)."""
+        if self._stats_dirty or self._stats_cache is None:
+            self._stats_dirty = False
+            self._stats_cache = MappingProxyType({
+                'name': self.module_name,
+                'category': self.category,
+                'status': self.status,
+                'exit_code': self.exit_code,
+                'duration': self.duration,
+                'start_time': self.start_time,
+                'end_time': self.end_time,
+                'temp_files_count': self._temp_file_count
+            })
+        return self._stats_cache
     
     def __repr__(self):
         return f"{self.__class__.__name__}(name={self.module_name}, category={self.category})"
@@ -7,13 +7,57 @@ scan profiles, and runtime parameters.
 """
 
 import os
+import mmap
+import re
+import shlex
+import logging
+import functools
 import yaml
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Union
+from dataclasses import dataclass, field, fields
 
+from ..helpers.dataclass_utils import with_slots
 
+# libyaml-backed loader/dumper are much faster than the pure Python ones
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# One "export KEY=value" per line; value is "...", '...' or (...) spanning the
+# rest of the line, otherwise the rest of the line as is (trailing blanks dropped)
+_EMBA_EXPORT_RE = re.compile(
+    r"""^[ \t]*export[ \t]+(\w+)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\n]*)"|'([^'\n]*)'|\(([^\n]*)\)|(.*?))[ \t\r]*$""",
+    re.M,
+)
+_EMBA_EXPORT_BYTES_RE = re.compile(_EMBA_EXPORT_RE.pattern.encode(), re.M)
+_EMBA_BOOLS = {
+    'true': True, '1': True, 'yes': True,
+    'false': False, '0': False, 'no': False,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _cpu_count() -> int:
+    """Get the number of CPUs this process may run on (respects cpusets)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not available on macOS/Windows
+        import multiprocessing
+        return multiprocessing.cpu_count()
+
+
+@with_slots
 @dataclass
 class PymbaConfig:
     """Main configuration class for Pymba."""
@@ -29,6 +73,10 @@ class PymbaConfig:
     config_dir: str = "config"
     scan_profiles_dir: str = "scan_profiles"
     
+    # Kernel analysis
+    kernel: bool = False
+    kernel_config: str = ""
+    
     # Analysis settings
     threaded: bool = True
     max_threads: int = 0  # Auto-detect if 0
@@ -60,6 +108,8 @@ class PymbaConfig:
     # Module settings
     module_blacklist: List[str] = field(default_factory=list)
     selected_modules: List[str] = field(default_factory=list)
+    eager_discovery: bool = False  # Import every module during discovery
+    module_cache_enabled: bool = True  # Reuse cached discovery results
     
     # Docker settings
     use_docker: bool = True
@@ -83,12 +133,10 @@ class PymbaConfig:
     def __post_init__(self):
         """Initialize computed fields after object creation."""
         if self.max_threads == 0:
-            import multiprocessing
-            self.max_threads = max(1, multiprocessing.cpu_count() // 2 + 1)
+            self.max_threads = max(1, _cpu_count() // 2 + 1)
         
         if self.max_module_threads == 0:
-            import multiprocessing
-            self.max_module_threads = multiprocessing.cpu_count() * 2
+            self.max_module_threads = _cpu_count() * 2
     
     @classmethod
     def load_from_profile(cls, profile_path: str) -> "PymbaConfig":
@@ -98,64 +146,95 @@ class PymbaConfig:
         if not os.path.exists(profile_path):
             raise FileNotFoundError(f"Profile file not found: {profile_path}")
         
-        with open(profile_path, 'r') as f:
+        with open(profile_path, 'rb') as f:
             if profile_path.endswith('.yaml') or profile_path.endswith('.yml'):
-                profile_data = yaml.safe_load(f)
+                # Byte stream, libyaml does the decoding
+                profile_data = yaml.load(f, Loader=_YamlLoader) or {}
+            elif os.fstat(f.fileno()).st_size:
+                # Handle .emba files (bash-style exports), parsed straight
+                # from the mapped file without reading it into a str first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    profile_data = cls._parse_emba_profile(mm)
             else:
-                # Handle .emba files (bash-style exports)
-                profile_data = cls._parse_emba_profile(f.read())
+                profile_data = {}
         
         # Update config with profile settings
+        known_fields = cls._FIELDS
         for key, value in profile_data.items():
-            if hasattr(config, key):
+            if key in known_fields:
                 setattr(config, key, value)
         
         return config
     
     @staticmethod
-    def _parse_emba_profile(content: str) -> Dict[str, Any]:
+    def _parse_emba_profile(content: Union[str, bytes, mmap.mmap]) -> Dict[str, Any]:
         """Parse EMBA-style profile files (bash exports)."""
+        if isinstance(content, str):
+            matches = (match.groups() for match in _EMBA_EXPORT_RE.finditer(content))
+        else:
+            matches = (
+                tuple(group.decode('utf-8') if group is not None else None
+                      for group in match.groups())
+                for match in _EMBA_EXPORT_BYTES_RE.finditer(content)
+            )
+        
         config = {}
-        for line in content.split('\n'):
-            line = line.strip()
-            if line.startswith('export ') and '=' in line:
-                # Remove 'export ' prefix
-                line = line[7:]
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    
-                    # Convert common values
-                    if value.lower() in ('true', '1', 'yes'):
-                        value = True
-                    elif value.lower() in ('false', '0', 'no'):
-                        value = False
-                    elif value.isdigit():
-                        value = int(value)
-                    elif value.startswith('(') and value.endswith(')'):
-                        # Handle arrays like ("module1" "module2")
-                        value = [item.strip('"') for item in value[1:-1].split()]
-                    
-                    config[key] = value
+        for key, double_quoted, single_quoted, array, bare in matches:
+            
+            if array is not None:
+                # Handle arrays like ("module1" "module2")
+                try:
+                    config[key] = shlex.split(array)
+                except ValueError as e:
+                    logging.getLogger('pymba').warning(f"Malformed array for {key} in EMBA profile: {e}")
+                    config[key] = [item.strip('"') for item in array.split()]
+                continue
+            
+            value = next(v for v in (double_quoted, single_quoted, bare) if v is not None)
+            
+            # Convert common values
+            converted = _EMBA_BOOLS.get(value.lower())
+            if converted is not None:
+                value = converted
+            elif value.isdigit():
+                value = int(value)
+            
+            config[key] = value
         
         return config
     
+    def public_items(self) -> Dict[str, Any]:
+        """
+        Get public configuration values that are set.
+        
+        The result is pre-filtered (no private or None values) so another
+        config can take them over in a single pass.
+        """
+        return {key: value for key, value in self._public_attrs()
+                if value is not None}
+    
+    def _public_attrs(self):
+        """Iterate over (name, value) pairs of all public configuration fields."""
+        for name in self.__slots__:
+            if not name.startswith('_'):
+                yield name, getattr(self, name)
+    
     def save_to_file(self, filepath: str):
-        """Save configuration to a YAML file."""
-        config_dict = {}
-        for key, value in self.__dict__.items():
-            if not key.startswith('_'):
-                config_dict[key] = value
+        """Save configuration to a YAML file, or JSON if filepath ends with .json."""
+        config_dict = dict(self._public_attrs())
+        
+        if filepath.endswith('.json'):
+            if orjson is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(config_dict, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(config_dict, f, indent=2)
+            return
         
         with open(filepath, 'w') as f:
-            yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+            yaml.dump(config_dict, f, Dumper=_YamlDumper,
+                      default_flow_style=False, indent=2, sort_keys=False)
     
     def get_config_file_path(self, filename: str) -> str:
         """Get full path to a config file."""
@@ -184,3 +263,7 @@ class PymbaConfig:
             issues.append("Max module threads must be at least 1")
         
         return issues
+
+
+# Field names accepted from scan profiles
+PymbaConfig._FIELDS = frozenset(f.name for f in fields(PymbaConfig))
@@ -7,16 +7,41 @@ the bash-based configuration system from EMBA.
 """
 
 import os
-import yaml
+import copy
 import json
-import configparser
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from enum import Enum
 
+from ..helpers.dataclass_utils import with_slots
 from ..helpers.logging_utils import LogManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Architectures accepted for target_architecture (kept lowercase)
+_VALID_ARCHS = frozenset({'mips', 'arm', 'x86', 'x64', 'ppc', 'aarch64'})
+
+# File suffixes list_scan_profiles() picks up
+_PROFILE_SUFFIXES = frozenset({'.yaml', '.yml', '.json'})
+
+# Keys create_scan_profile() writes next to the config fields
+_PROFILE_METADATA_KEYS = frozenset({'profile_name', 'description', 'created_by'})
+
+# Spellings accepted for boolean config values
+_TRUE_VALUES = frozenset({'true', 'yes', 'on', '1'})
+_FALSE_VALUES = frozenset({'false', 'no', 'off', '0'})
+
+# First characters a number can start with; anything else skips int()/float()
+_NUMERIC_START = frozenset('+-.0123456789')
+
+# Parsed config files, keyed by (path, mtime_ns, size) so edits invalidate them
+_PARSED_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
 
 class ConfigFormat(Enum):
     """Supported configuration file formats."""
@@ -26,6 +51,7 @@ class ConfigFormat(Enum):
     PY = "py"
 
 
+@with_slots
 @dataclass
 class PymbaConfig:
     """Main Pymba configuration class."""
@@ -46,6 +72,8 @@ class PymbaConfig:
     max_parallel_modules: int = 4
     max_threads_per_module: int = 2
     use_multiprocessing: bool = False
+    eager_discovery: bool = False  # Import every module during discovery
+    module_cache_enabled: bool = True  # Reuse cached discovery results
     module_timeout: Optional[int] = None
     
     # Architecture and platform
@@ -81,11 +109,22 @@ class PymbaConfig:
     def __post_init__(self):
         if self.exclude_paths is None:
             self.exclude_paths = []
+        if isinstance(self.target_architecture, str):
+            self.target_architecture = self.target_architecture.lower()
+
+
+# Names of all PymbaConfig fields, for cheap key checks
+_FIELDS = frozenset(f.name for f in fields(PymbaConfig))
 
 
 class ConfigManager:
     """Manages configuration loading, saving, and validation."""
     
+    # PyYAML is only imported once a YAML file is handled, see _get_yaml()
+    _yaml = None
+    _yaml_loader = None
+    _yaml_dumper = None
+    
     def __init__(self, log_manager: LogManager):
         self.log_manager = log_manager
         self.config: Optional[PymbaConfig] = None
@@ -99,11 +138,44 @@ class ConfigManager:
             Path("~/.pymba/config.json"),
             Path("/etc/pymba/config.yaml")
         ]
+        self._default_config: Optional[Path] = None
+        self._default_config_resolved = False
+    
+    def resolve_default_config(self) -> Optional[Path]:
+        """
+        Get the highest priority default config file that exists.
+        
+        Candidates sharing a directory are checked with a single scandir()
+        of that directory, and the result is memoized for this manager.
+        """
+        if self._default_config_resolved:
+            return self._default_config
+        
+        candidates = [path.expanduser() for path in self.default_config_paths]
+        
+        # One directory listing per distinct parent
+        present: Dict[Path, set] = {}
+        for parent in dict.fromkeys(path.parent for path in candidates):
+            try:
+                with os.scandir(parent) as entries:
+                    present[parent] = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                present[parent] = set()
+        
+        self._default_config = next(
+            (path for path in candidates if path.name in present[path.parent]), None
+        )
+        self._default_config_resolved = True
+        return self._default_config
     
     def load_default_config(self) -> PymbaConfig:
-        """Load default configuration."""
+        """Load default configuration, merged with the default config file if any."""
         self.config = PymbaConfig()
         
+        default_config = self.resolve_default_config()
+        if default_config is not None:
+            self.load_config_file(default_config)
+        
         # Set default paths
         if not self.config.log_dir:
             self.config.log_dir = str(Path.cwd() / "pymba_logs")
@@ -120,41 +192,64 @@ class ConfigManager:
         """Load configuration from a file."""
         config_path = Path(config_path).expanduser().resolve()
         
-        if not config_path.exists():
-            self.log_manager.print_warning(f"Configuration file not found: {config_path}")
-            return False
-        
         try:
-            config_format = self._detect_config_format(config_path)
-            
-            if config_format == ConfigFormat.YAML:
-                config_data = self._load_yaml_config(config_path)
-            elif config_format == ConfigFormat.JSON:
-                config_data = self._load_json_config(config_path)
-            elif config_format == ConfigFormat.INI:
-                config_data = self._load_ini_config(config_path)
-            elif config_format == ConfigFormat.PY:
+            if config_path.suffix.lower() == '.py':
                 config_data = self._load_python_config(config_path)
             else:
-                self.log_manager.print_error(f"Unsupported configuration format: {config_format}")
-                return False
+                config_data = self._read_config_data(config_path)
             
             # Merge with existing config
             if self.config:
                 self._merge_config_data(config_data)
             else:
-                self.config = PymbaConfig(**config_data)
+                self.config = PymbaConfig(**self._filter_config_data(config_data))
             
             self.config_files.append(config_path)
             self.log_manager.print_success(f"Loaded configuration from: {config_path}")
             return True
             
+        except FileNotFoundError:
+            self.log_manager.print_warning(f"Configuration file not found: {config_path}")
+            return False
         except Exception as e:
             self.log_manager.print_error(f"Failed to load configuration from {config_path}: {e}")
             return False
     
-    def _detect_config_format(self, config_path: Path) -> ConfigFormat:
-        """Detect configuration file format."""
+    def _read_config_data(self, config_path: Path) -> Dict[str, Any]:
+        """
+        Read and parse a YAML, JSON or INI configuration file.
+        
+        The file is opened and read once; format sniffing and parsing work
+        on the same bytes. Parsed results are cached by (path, mtime, size),
+        so an unchanged file is not parsed again.
+        """
+        with open(config_path, 'rb') as f:
+            fd = f.fileno()
+            st = os.fstat(fd)
+            key = (str(config_path), st.st_mtime_ns, st.st_size)
+            config_data = _PARSED_CACHE.get(key)
+            
+            if config_data is None:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                data = f.read()
+                config_format = self._detect_config_format(config_path, data[:100])
+                
+                if config_format == ConfigFormat.YAML:
+                    config_data = self._load_yaml_config(data)
+                elif config_format == ConfigFormat.JSON:
+                    config_data = self._load_json_config(data)
+                elif config_format == ConfigFormat.INI:
+                    config_data = self._load_ini_config(data)
+                else:
+                    raise ValueError(f"Unsupported configuration format: {config_format}")
+                _PARSED_CACHE[key] = config_data
+        
+        # Callers merge and mutate the result, keep the cached copy pristine
+        return copy.deepcopy(config_data)
+    
+    def _detect_config_format(self, config_path: Path, head: Optional[bytes] = None) -> ConfigFormat:
+        """Detect configuration file format, optionally from its first bytes."""
         suffix = config_path.suffix.lower()
         
         if suffix in ['.yaml', '.yml']:
@@ -168,33 +263,55 @@ class ConfigManager:
         else:
             # Try to detect by content
             try:
-                with open(config_path, 'r') as f:
-                    content = f.read(100).strip()
-                    if content.startswith('{'):
-                        return ConfigFormat.JSON
-                    elif content.startswith('---') or ':' in content:
-                        return ConfigFormat.YAML
-                    elif '=' in content:
-                        return ConfigFormat.INI
+                if head is None:
+                    with open(config_path, 'rb') as f:
+                        head = f.read(100)
+                content = head.decode('utf-8', errors='ignore').strip()
+                if content.startswith('{'):
+                    return ConfigFormat.JSON
+                elif content.startswith('---') or ':' in content:
+                    return ConfigFormat.YAML
+                elif '=' in content:
+                    return ConfigFormat.INI
             except:
                 pass
             
             return ConfigFormat.INI  # Default fallback
     
-    def _load_yaml_config(self, config_path: Path) -> Dict[str, Any]:
-        """Load YAML configuration file."""
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f) or {}
-    
-    def _load_json_config(self, config_path: Path) -> Dict[str, Any]:
-        """Load JSON configuration file."""
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    
-    def _load_ini_config(self, config_path: Path) -> Dict[str, Any]:
-        """Load INI configuration file."""
+    def _get_yaml(self):
+        """Import PyYAML on first use, preferring the libyaml loader/dumper."""
+        if ConfigManager._yaml is None:
+            import yaml
+            try:
+                loader, dumper = yaml.CSafeLoader, yaml.CSafeDumper
+            except AttributeError:
+                loader, dumper = yaml.SafeLoader, yaml.SafeDumper
+                self.log_manager.print_warning(
+                    "PyYAML was built without libyaml, config loading will be slow "
+                    "(install libyaml-dev and reinstall PyYAML)"
+                )
+            ConfigManager._yaml_loader = loader
+            ConfigManager._yaml_dumper = dumper
+            ConfigManager._yaml = yaml
+        return ConfigManager._yaml
+    
+    def _load_yaml_config(self, data: bytes) -> Dict[str, Any]:
+        """Parse YAML configuration data."""
+        yaml = self._get_yaml()
+        return yaml.load(data, Loader=self._yaml_loader) or {}
+    
+    def _load_json_config(self, data: bytes) -> Dict[str, Any]:
+        """Parse JSON configuration data."""
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    
+    def _load_ini_config(self, data: bytes) -> Dict[str, Any]:
+        """Parse INI configuration data."""
+        import configparser
+        
         config_parser = configparser.ConfigParser()
-        config_parser.read(config_path)
+        config_parser.read_string(data.decode('utf-8'))
         
         config_data = {}
         for section_name in config_parser.sections():
@@ -214,34 +331,34 @@ class ConfigManager:
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
         
-        # Extract configuration from module
-        config_data = {}
-        for attr_name in dir(module):
-            if not attr_name.startswith('_'):
-                attr_value = getattr(module, attr_name)
-                if isinstance(attr_value, (str, int, float, bool, list, dict)):
-                    config_data[attr_name] = attr_value
-        
-        return config_data
+        # Extract configuration from module, in definition order
+        return {
+            attr_name: attr_value
+            for attr_name, attr_value in vars(module).items()
+            if not attr_name.startswith('_')
+            and isinstance(attr_value, (str, int, float, bool, list, dict))
+        }
     
     def _convert_config_value(self, value: str) -> Any:
         """Convert string configuration value to appropriate type."""
         value = value.strip()
         
         # Boolean values
-        if value.lower() in ['true', 'yes', 'on', '1']:
+        lowered = value.lower()
+        if lowered in _TRUE_VALUES:
             return True
-        elif value.lower() in ['false', 'no', 'off', '0']:
+        elif lowered in _FALSE_VALUES:
             return False
         
         # Numeric values
-        try:
-            if '.' in value:
-                return float(value)
-            else:
-                return int(value)
-        except ValueError:
-            pass
+        if value[:1] in _NUMERIC_START:
+            try:
+                if '.' in value:
+                    return float(value)
+                else:
+                    return int(value)
+            except ValueError:
+                pass
         
         # List values (comma-separated)
         if ',' in value:
@@ -255,21 +372,32 @@ class ConfigManager:
         if not self.config:
             return
         
-        config_dict = asdict(self.config)
-        
-        # Recursive merge
-        self._recursive_update(config_dict, new_data)
-        
-        # Update config object
-        self.config = PymbaConfig(**config_dict)
+        # Update only the fields present in new_data, in place
+        for key, value in self._filter_config_data(new_data).items():
+            if key == 'target_architecture' and isinstance(value, str):
+                value = value.lower()
+            setattr(self.config, key, value)
     
-    def _recursive_update(self, base_dict: Dict[str, Any], update_dict: Dict[str, Any]):
-        """Recursively update dictionary."""
-        for key, value in update_dict.items():
-            if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                self._recursive_update(base_dict[key], value)
+    def _filter_config_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only the keys that name PymbaConfig fields, warning about the rest."""
+        filtered = {}
+        unknown = []
+        for key, value in data.items():
+            if key in _FIELDS:
+                filtered[key] = value
+            elif isinstance(value, dict):
+                # Nested sections (INI files) map onto prefixed field names
+                for flat_key, flat_value in self._flatten_dict(value, key).items():
+                    if flat_key in _FIELDS:
+                        filtered[flat_key] = flat_value
+                    else:
+                        unknown.append(flat_key)
             else:
-                base_dict[key] = value
+                unknown.append(key)
+        
+        if unknown:
+            self.log_manager.print_warning(f"Ignoring unknown configuration keys: {', '.join(unknown)}")
+        return filtered
     
     def save_config(self, config_path: Union[str, Path], 
                    format: Optional[ConfigFormat] = None) -> bool:
@@ -306,16 +434,23 @@ class ConfigManager:
     
     def _save_yaml_config(self, config_path: Path, config_data: Dict[str, Any]):
         """Save configuration as YAML."""
+        yaml = self._get_yaml()
         with open(config_path, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False, indent=2)
+            yaml.dump(config_data, f, Dumper=self._yaml_dumper,
+                      default_flow_style=False, indent=2, sort_keys=False)
     
     def _save_json_config(self, config_path: Path, config_data: Dict[str, Any]):
         """Save configuration as JSON."""
+        if orjson is not None:
+            config_path.write_bytes(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+            return
         with open(config_path, 'w') as f:
             json.dump(config_data, f, indent=2)
     
     def _save_ini_config(self, config_path: Path, config_data: Dict[str, Any]):
         """Save configuration as INI."""
+        import configparser
+        
         config_parser = configparser.ConfigParser()
         
         # Flatten nested dictionaries
@@ -330,13 +465,10 @@ class ConfigManager:
             else:
                 option = key
             
-            if section not in sections:
-                sections[section] = {}
-            sections[section][option] = str(value)
+            sections.setdefault(section, {})[option] = str(value)
         
-        # Add sections to parser
-        for section_name, section_data in sections.items():
-            config_parser[section_name] = section_data
+        # Add all sections to the parser in one call
+        config_parser.read_dict(sections)
         
         with open(config_path, 'w') as f:
             config_parser.write(f)
@@ -344,12 +476,19 @@ class ConfigManager:
     def _flatten_dict(self, data: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
         """Flatten nested dictionary."""
         result = {}
-        for key, value in data.items():
-            new_key = f"{prefix}_{key}" if prefix else key
-            if isinstance(value, dict):
-                result.update(self._flatten_dict(value, new_key))
+        store = result.__setitem__
+        # Stack of (prefix, items iterator) keeps the key order of the recursion
+        stack = [(prefix, iter(data.items()))]
+        while stack:
+            current_prefix, items = stack[-1]
+            for key, value in items:
+                new_key = "_".join((current_prefix, str(key))) if current_prefix else key
+                if isinstance(value, dict):
+                    stack.append((new_key, iter(value.items())))
+                    break
+                store(new_key, value)
             else:
-                result[new_key] = value
+                stack.pop()
         return result
     
     def validate_config(self) -> List[str]:
@@ -362,7 +501,7 @@ class ConfigManager:
         # Validate required paths
         if not self.config.firmware_path:
             issues.append("Firmware path is required")
-        elif not Path(self.config.firmware_path).exists():
+        elif not os.path.exists(self.config.firmware_path):
             issues.append(f"Firmware path does not exist: {self.config.firmware_path}")
         
         if not self.config.log_dir:
@@ -377,8 +516,7 @@ class ConfigManager:
         
         # Validate architecture
         if self.config.target_architecture:
-            valid_archs = ['mips', 'arm', 'x86', 'x64', 'ppc', 'aarch64']
-            if self.config.target_architecture.lower() not in valid_archs:
+            if self.config.target_architecture not in _VALID_ARCHS:
                 issues.append(f"Invalid target architecture: {self.config.target_architecture}")
         
         return issues
@@ -390,6 +528,8 @@ class ConfigManager:
         
         # Support dot notation for nested keys
         keys = key.split('.')
+        if keys[0] not in _FIELDS:
+            return default
         value = self.config
         
         for k in keys:
@@ -408,6 +548,8 @@ class ConfigManager:
         try:
             # Support dot notation for nested keys
             keys = key.split('.')
+            if keys[0] not in _FIELDS:
+                return False
             obj = self.config
             
             for k in keys[:-1]:
@@ -415,6 +557,8 @@ class ConfigManager:
                     return False
                 obj = getattr(obj, k)
             
+            if key == 'target_architecture' and isinstance(value, str):
+                value = value.lower()
             setattr(obj, keys[-1], value)
             return True
             
@@ -425,18 +569,12 @@ class ConfigManager:
         """Load scan profile configuration."""
         profile_path = Path(profile_path).expanduser().resolve()
         
-        if not profile_path.exists():
-            self.log_manager.print_error(f"Scan profile not found: {profile_path}")
-            return False
-        
         try:
             # Load profile as YAML or JSON
-            if profile_path.suffix.lower() in ['.yaml', '.yml']:
-                with open(profile_path, 'r') as f:
-                    profile_data = yaml.safe_load(f)
-            elif profile_path.suffix.lower() == '.json':
-                with open(profile_path, 'r') as f:
-                    profile_data = json.load(f)
+            if profile_path.suffix.lower() in ['.yaml', '.yml', '.json']:
+                profile_data = self._read_config_data(profile_path)
+                for key in _PROFILE_METADATA_KEYS:
+                    profile_data.pop(key, None)
             else:
                 self.log_manager.print_error(f"Unsupported profile format: {profile_path.suffix}")
                 return False
@@ -445,11 +583,14 @@ class ConfigManager:
             if self.config:
                 self._merge_config_data(profile_data)
             else:
-                self.config = PymbaConfig(**profile_data)
+                self.config = PymbaConfig(**self._filter_config_data(profile_data))
             
             self.log_manager.print_success(f"Loaded scan profile: {profile_path}")
             return True
             
+        except FileNotFoundError:
+            self.log_manager.print_error(f"Scan profile not found: {profile_path}")
+            return False
         except Exception as e:
             self.log_manager.print_error(f"Failed to load scan profile {profile_path}: {e}")
             return False
@@ -472,8 +613,10 @@ class ConfigManager:
                 **asdict(self.config)
             }
             
+            yaml = self._get_yaml()
             with open(profile_path, 'w') as f:
-                yaml.dump(profile_data, f, default_flow_style=False, indent=2)
+                yaml.dump(profile_data, f, Dumper=self._yaml_dumper,
+                          default_flow_style=False, indent=2, sort_keys=False)
             
             self.log_manager.print_success(f"Created scan profile: {profile_path}")
             return True
@@ -486,14 +629,18 @@ class ConfigManager:
         """List available scan profiles."""
         profiles_dir = Path(profiles_dir).expanduser().resolve()
         
-        if not profiles_dir.exists():
-            return []
-        
+        # One directory listing, filtered by suffix
         profiles = []
-        for pattern in ['*.yaml', '*.yml', '*.json']:
-            profiles.extend(profiles_dir.glob(pattern))
+        try:
+            with os.scandir(profiles_dir) as entries:
+                for entry in entries:
+                    if os.path.splitext(entry.name)[1].lower() in _PROFILE_SUFFIXES and entry.is_file():
+                        profiles.append(Path(entry.path))
+        except OSError:
+            return []
         
-        return sorted(profiles)
+        profiles.sort()
+        return profiles
     
     def get_config_summary(self) -> Dict[str, Any]:
         """Get configuration summary."""
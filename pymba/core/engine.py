@@ -17,6 +17,13 @@ from .module_manager import ModuleManager
 from ..helpers.system_utils import ensure_tools
 
 
+# External tools and the extractor modules that need them
+EXTRACTOR_TOOLS = {
+    'binwalk': 'P50_binwalk_extractor',
+    'unblob': 'P55_unblob_extractor',
+}
+
+
 class PymbaEngine:
     """Main orchestration engine for Pymba firmware analysis."""
     
@@ -63,11 +70,9 @@ class PymbaEngine:
     def _ensure_external_tools(self):
         """Check and auto-install external tools if required by enabled modules."""
         # Only ensure extractors if they are not blacklisted
-        tools_to_check = []
-        if 'P50_binwalk_extractor' not in self.config.module_blacklist:
-            tools_to_check.append('binwalk')
-        if 'P55_unblob_extractor' not in self.config.module_blacklist:
-            tools_to_check.append('unblob')
+        blacklist = set(self.config.module_blacklist)
+        tools_to_check = [tool for tool, module in EXTRACTOR_TOOLS.items()
+                          if module not in blacklist]
         if not tools_to_check:
             return
         self.logger.info(f"Ensuring external tools are available: {', '.join(tools_to_check)}")
@@ -138,22 +143,23 @@ Configuration Summary:
             self._cleanup()
             sys.exit(1)
     
-    def _run_pre_checking_phase(self):
-        """Run the pre-checking and extraction phase (P-modules)."""
+    def _run_phase(self, group: str, label: str, threaded: bool) -> List[int]:
+        """Run one module group as an analysis phase and return its exit codes."""
         self.logger.print_bar()
-        self.logger.info("Pre-checking phase started")
-        self.logger.write_notification("Pre-checking phase started")
-        
-        phase_start = time.time()
-        
-        # Run P-modules
-        exit_codes = self.module_manager.run_module_group('P', self.config.threaded)
+        self.logger.info(f"{label} phase started")
+        self.logger.write_notification(f"{label} phase started")
         
-        phase_end = time.time()
-        phase_duration = phase_end - phase_start
+        phase_start = time.perf_counter()
+        exit_codes = self.module_manager.run_module_group(group, threaded)
+        phase_duration = time.perf_counter() - phase_start
         
-        self.logger.info(f"Pre-checking phase completed in {phase_duration:.2f} seconds")
-        self.logger.write_notification("Pre-checking phase completed")
+        self.logger.info(f"{label} phase completed in {phase_duration:.2f} seconds")
+        self.logger.write_notification(f"{label} phase completed")
+        return exit_codes
+    
+    def _run_pre_checking_phase(self):
+        """Run the pre-checking and extraction phase (P-modules)."""
+        exit_codes = self._run_phase('P', "Pre-checking", self.config.threaded)
         
         # Check if any modules failed critically
         critical_failures = [code for code in exit_codes if code != 0]
@@ -166,54 +172,17 @@ Configuration Summary:
     
     def _run_security_analysis_phase(self):
         """Run the security analysis phase (S-modules)."""
-        self.logger.print_bar()
-        self.logger.info("Security analysis phase started")
-        self.logger.write_notification("Security analysis phase started")
-        
-        phase_start = time.time()
-        
-        # Run S-modules
-        exit_codes = self.module_manager.run_module_group('S', self.config.threaded)
-        
-        phase_end = time.time()
-        phase_duration = phase_end - phase_start
-        
-        self.logger.info(f"Security analysis phase completed in {phase_duration:.2f} seconds")
-        self.logger.write_notification("Security analysis phase completed")
+        self._run_phase('S', "Security analysis", self.config.threaded)
     
     def _run_emulation_phase(self):
         """Run the live emulation phase (L-modules)."""
-        self.logger.print_bar()
-        self.logger.info("Live emulation phase started")
-        self.logger.write_notification("Live emulation phase started")
-        
-        phase_start = time.time()
-        
-        # Run L-modules (not threaded by default due to emulation complexity)
-        exit_codes = self.module_manager.run_module_group('L', threaded=False)
-        
-        phase_end = time.time()
-        phase_duration = phase_end - phase_start
-        
-        self.logger.info(f"Live emulation phase completed in {phase_duration:.2f} seconds")
-        self.logger.write_notification("Live emulation phase completed")
+        # Not threaded by default due to emulation complexity
+        self._run_phase('L', "Live emulation", threaded=False)
     
     def _run_reporting_phase(self):
         """Run the final reporting phase (F-modules)."""
-        self.logger.print_bar()
-        self.logger.info("Reporting phase started")
-        self.logger.write_notification("Reporting phase started")
-        
-        phase_start = time.time()
-        
-        # Run F-modules (not threaded to ensure proper ordering)
-        exit_codes = self.module_manager.run_module_group('F', threaded=False)
-        
-        phase_end = time.time()
-        phase_duration = phase_end - phase_start
-        
-        self.logger.info(f"Reporting phase completed in {phase_duration:.2f} seconds")
-        self.logger.write_notification("Reporting phase completed")
+        # Not threaded to ensure proper ordering
+        self._run_phase('F', "Reporting", threaded=False)
     
     def _finalize_analysis(self):
         """Finalize the analysis and print summary."""
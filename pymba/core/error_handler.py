@@ -6,43 +6,88 @@ This module provides comprehensive error handling and recovery mechanisms
 for Pymba, replacing the bash-based error handling from EMBA.
 """
 
-import os
 import sys
-import traceback
 import logging
 import signal
 import threading
 import time
-from typing import Dict, List, Optional, Any, Callable, Union
+from typing import Dict, List, Optional, Any, Callable, Union, Tuple
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
+from array import array
 import functools
+import itertools
+import queue
+import weakref
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from collections import deque
 
 from ..helpers.logging_utils import LogManager
+from ..helpers.dataclass_utils import with_slots
 
 
-class ErrorSeverity(Enum):
+# Number of ErrorInfo records kept in ErrorHandler.error_history
+ERROR_HISTORY_SIZE = 1024
+
+# Seconds to wait at interpreter exit for queued errors to be recorded
+EXIT_FLUSH_TIMEOUT = 2.0
+
+# Token bucket limiting how often one (error_type, module_name) is logged and fanned out,
+# HIGH and CRITICAL errors are never limited
+ERROR_RATE_BURST = 10
+ERROR_RATE_PER_SEC = 5.0
+
+
+class ErrorSeverity(IntEnum):
     """Error severity levels."""
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    CRITICAL = 3
 
 
-class ErrorCategory(Enum):
+class ErrorCategory(IntEnum):
     """Error categories."""
-    CONFIGURATION = "configuration"
-    DEPENDENCY = "dependency"
-    MODULE = "module"
-    SYSTEM = "system"
-    NETWORK = "network"
-    PERMISSION = "permission"
-    RESOURCE = "resource"
-    TIMEOUT = "timeout"
-    VALIDATION = "validation"
-    UNKNOWN = "unknown"
+    CONFIGURATION = 0
+    DEPENDENCY = 1
+    MODULE = 2
+    SYSTEM = 3
+    NETWORK = 4
+    PERMISSION = 5
+    RESOURCE = 6
+    TIMEOUT = 7
+    VALIDATION = 8
+    UNKNOWN = 9
+
+
+# Category assigned to uncategorized errors, by exception type
+_CATEGORY_BY_TYPE = {
+    FileNotFoundError: ErrorCategory.PERMISSION,
+    PermissionError: ErrorCategory.PERMISSION,
+    ConnectionError: ErrorCategory.NETWORK,
+    TimeoutError: ErrorCategory.NETWORK,
+    ValueError: ErrorCategory.VALIDATION,
+    TypeError: ErrorCategory.VALIDATION,
+    MemoryError: ErrorCategory.RESOURCE,
+}
+
+# Lowercase names used as keys in summaries, indexed by enum value
+_SEVERITY_NAMES = tuple(severity.name.lower() for severity in ErrorSeverity)
+_CATEGORY_NAMES = tuple(category.name.lower() for category in ErrorCategory)
 
 
+def _extract_frames(tb) -> Tuple[Tuple[str, int, str], ...]:
+    """Collect (filename, lineno, funcname) for each traceback entry."""
+    frames = []
+    while tb is not None:
+        code = tb.tb_frame.f_code
+        frames.append((sys.intern(code.co_filename), tb.tb_lineno, code.co_name))
+        tb = tb.tb_next
+    return tuple(frames)
+
+
+@with_slots
 @dataclass
 class ErrorInfo:
     """Information about an error."""
@@ -51,12 +96,31 @@ class ErrorInfo:
     severity: ErrorSeverity
     category: ErrorCategory
     module_name: Optional[str] = None
-    timestamp: float = field(default_factory=time.time)
-    traceback: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)  # Wall clock, for display only
+    mono_ns: int = field(default_factory=time.monotonic_ns)  # For timing and ordering
+    _traceback: Optional[str] = field(default=None, repr=False, compare=False)
+    frames: Tuple[Tuple[str, int, str], ...] = field(default=(), repr=False)  # Formatted on demand
     context: Dict[str, Any] = field(default_factory=dict)
     recoverable: bool = True
     retry_count: int = 0
     max_retries: int = 3
+    
+    @property
+    def traceback(self) -> Optional[str]:
+        """Formatted traceback, rendered from frames on first access."""
+        if self._traceback is None and self.frames:
+            self._traceback = self.format_frames()
+        return self._traceback
+    
+    def format_frames(self) -> str:
+        """Render the stored frames as a traceback."""
+        if not self.frames:
+            return ""
+        lines = ["Traceback (most recent call last):"]
+        lines.extend(f'  File "{filename}", line {lineno}, in {name}'
+                     for filename, lineno, name in self.frames)
+        lines.append(f"{self.error_type}: {self.message}")
+        return "\n".join(lines)
 
 
 class ErrorRecoveryStrategy:
@@ -90,22 +154,29 @@ class RetryStrategy(ErrorRecoveryStrategy):
         if not self.can_recover(error):
             return False
         
-        # Calculate delay with exponential backoff
-        delay = self.delay * (self.backoff ** error.retry_count)
-        
         # Get the original function and arguments
         original_func = context.get('function')
         args = context.get('args', ())
         kwargs = context.get('kwargs', {})
         
-        if original_func:
+        if not original_func:
+            return False
+        
+        # Make every remaining attempt here, escalating only after the last one fails
+        while error.retry_count < self.max_retries:
+            # Calculate delay with exponential backoff, measured on the monotonic clock
+            delay_ns = int(self.delay * (self.backoff ** error.retry_count) * 1e9)
+            deadline = time.monotonic_ns() + delay_ns
+            remaining = delay_ns
+            while remaining > 0:
+                time.sleep(remaining / 1e9)
+                remaining = deadline - time.monotonic_ns()
+            
             try:
-                time.sleep(delay)
-                result = original_func(*args, **kwargs)
+                original_func(*args, **kwargs)
                 return True
-            except Exception as e:
+            except Exception:
                 error.retry_count += 1
-                return False
         
         return False
 
@@ -158,23 +229,47 @@ class ResourceCleanupStrategy(ErrorRecoveryStrategy):
 class ErrorHandler:
     """Main error handling system for Pymba."""
     
-    def __init__(self, log_manager: LogManager):
+    def __init__(self, log_manager: LogManager, history_size: int = ERROR_HISTORY_SIZE):
         self.log_manager = log_manager
-        self.error_history: List[ErrorInfo] = []
+        # Bounded, the oldest records are dropped once history_size is reached
+        self.error_history: "deque[ErrorInfo]" = deque(maxlen=history_size)
         self.recovery_strategies: List[ErrorRecoveryStrategy] = []
         self.error_callbacks: List[Callable[[ErrorInfo], None]] = []
         
+        # Log method and message prefix for each severity, indexed by enum value
+        self._severity_dispatch = (
+            (log_manager.print_info, "LOW ERROR: "),
+            (log_manager.print_warning, "MEDIUM ERROR: "),
+            (log_manager.print_error, "HIGH ERROR: "),
+            (log_manager.print_error, "CRITICAL ERROR: "),
+        )
+        
+        # Token buckets per (error_type, module_name), only touched by the consumer thread
+        self._rate_buckets: Dict[tuple, tuple] = {}
+        self._suppressed_errors = 0
+        
+        # Resolved auto-category per exception type
+        self._category_cache: Dict[type, ErrorCategory] = {}
+        
+        # Bookkeeping (logging, history, stats, callbacks) runs on a consumer thread.
+        # SimpleQueue.put is reentrant, so the signal handler can queue errors too.
+        self._pending: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._bookkeeper = threading.Thread(
+            target=self._bookkeeping_loop, name="pymba-error-bookkeeper", daemon=True
+        )
+        self._bookkeeper.start()
+        weakref.finalize(self, _drain_queue, self._pending, EXIT_FLUSH_TIMEOUT)
+        
         # Initialize default recovery strategies
         self._initialize_default_strategies()
         
         # Setup signal handlers
         self._setup_signal_handlers()
         
-        # Error statistics
+        # Error statistics, per-severity and per-category counts indexed by enum value
+        self._severity_counts = array('Q', [0] * len(ErrorSeverity))
+        self._category_counts = array('Q', [0] * len(ErrorCategory))
         self.error_stats = {
-            'total_errors': 0,
-            'errors_by_severity': {severity.value: 0 for severity in ErrorSeverity},
-            'errors_by_category': {category.value: 0 for category in ErrorCategory},
             'recovery_attempts': 0,
             'successful_recoveries': 0
         }
@@ -188,13 +283,16 @@ class ErrorHandler:
     def _setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown."""
         def signal_handler(signum, frame):
-            self.log_manager.print_warning(f"Received signal {signum}, initiating graceful shutdown...")
-            self.handle_critical_error(
-                f"Received signal {signum}",
-                ErrorCategory.SYSTEM,
-                ErrorSeverity.CRITICAL,
-                context={'signal': signum, 'frame': str(frame)}
-            )
+            # Takes no locks and does no I/O, the consumer thread logs the error
+            self._pending.put(ErrorInfo(
+                error_type="CriticalError",
+                message=f"Received signal {signum}, initiating graceful shutdown...",
+                severity=ErrorSeverity.CRITICAL,
+                category=ErrorCategory.SYSTEM,
+                context={'signal': signum},
+                recoverable=False
+            ))
+            raise SystemExit(1)
         
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
@@ -223,24 +321,78 @@ class ErrorHandler:
     
     def handle_error_info(self, error_info: ErrorInfo) -> bool:
         """Handle an error info object and attempt recovery."""
-        # Log the error
-        self._log_error(error_info)
+        # Hand bookkeeping off to the consumer thread
+        self._pending.put(error_info)
         
+        # Attempt recovery, the caller needs the result synchronously
+        return self._attempt_recovery(error_info)
+    
+    def _bookkeeping_loop(self):
+        """Drain queued errors in batches and record them."""
+        pending = self._pending
+        while True:
+            batch = [pending.get()]
+            try:
+                while True:
+                    batch.append(pending.get_nowait())
+            except queue.Empty:
+                pass
+            
+            for error_info in batch:
+                # flush() markers are set once everything queued before them is recorded
+                if isinstance(error_info, threading.Event):
+                    error_info.set()
+                    continue
+                
+                try:
+                    self._record_error(error_info)
+                except Exception as e:
+                    # Keep the consumer alive, flush() would otherwise never return
+                    try:
+                        self.log_manager.print_warning(f"Failed to record error: {e}")
+                    except Exception:
+                        pass
+    
+    def _record_error(self, error_info: ErrorInfo):
+        """Log, store, count and fan out an error."""
         # Record in history
         self.error_history.append(error_info)
         
         # Update statistics
         self._update_error_stats(error_info)
         
+        # Repeats beyond the rate limit are counted but not logged or fanned out
+        if error_info.severity < ErrorSeverity.HIGH and not self._take_token(error_info):
+            self._suppressed_errors += 1
+            return
+        
+        # Log the error
+        self._log_error(error_info)
+        
         # Notify callbacks
         for callback in self.error_callbacks:
             try:
                 callback(error_info)
             except Exception as e:
                 self.log_manager.print_warning(f"Error callback failed: {e}")
+    
+    def _take_token(self, error_info: ErrorInfo) -> bool:
+        """Take a token from the error's rate bucket, False if it is empty."""
+        key = (error_info.error_type, error_info.module_name)
+        now = error_info.mono_ns
+        tokens, last = self._rate_buckets.get(key, (ERROR_RATE_BURST, now))
+        tokens = min(ERROR_RATE_BURST, tokens + (now - last) / 1e9 * ERROR_RATE_PER_SEC)
+        
+        if tokens < 1:
+            self._rate_buckets[key] = (tokens, now)
+            return False
         
-        # Attempt recovery
-        return self._attempt_recovery(error_info)
+        self._rate_buckets[key] = (tokens - 1, now)
+        return True
+    
+    def flush(self, timeout: Optional[float] = None):
+        """Wait until all errors queued so far have been recorded."""
+        _drain_queue(self._pending, timeout)
     
     def _create_error_info(self, error: Exception,
                           category: ErrorCategory,
@@ -250,21 +402,15 @@ class ErrorHandler:
         """Create ErrorInfo object from exception."""
         error_type = type(error).__name__
         message = str(error)
-        traceback_str = traceback.format_exc()
         
         # Determine if error is recoverable based on type
         recoverable = not isinstance(error, (SystemExit, KeyboardInterrupt, MemoryError))
         
         # Auto-categorize based on error type
         if category == ErrorCategory.UNKNOWN:
-            if isinstance(error, (FileNotFoundError, PermissionError)):
-                category = ErrorCategory.PERMISSION
-            elif isinstance(error, (ConnectionError, TimeoutError)):
-                category = ErrorCategory.NETWORK
-            elif isinstance(error, (ValueError, TypeError)):
-                category = ErrorCategory.VALIDATION
-            elif isinstance(error, MemoryError):
-                category = ErrorCategory.RESOURCE
+            category = self._category_cache.get(type(error))
+            if category is None:
+                category = self._resolve_category(type(error))
         
         return ErrorInfo(
             error_type=error_type,
@@ -272,35 +418,39 @@ class ErrorHandler:
             severity=severity,
             category=category,
             module_name=module_name,
-            traceback=traceback_str,
+            frames=_extract_frames(error.__traceback__),
             context=context or {},
             recoverable=recoverable
         )
     
+    def _resolve_category(self, error_type: type) -> ErrorCategory:
+        """Find the category for an exception type from its MRO and memoize it."""
+        category = ErrorCategory.UNKNOWN
+        for base in error_type.__mro__:
+            if base in _CATEGORY_BY_TYPE:
+                category = _CATEGORY_BY_TYPE[base]
+                break
+        self._category_cache[error_type] = category
+        return category
+    
     def _log_error(self, error_info: ErrorInfo):
         """Log error information."""
-        if error_info.severity == ErrorSeverity.CRITICAL:
-            self.log_manager.print_error(f"CRITICAL ERROR: {error_info.message}")
-        elif error_info.severity == ErrorSeverity.HIGH:
-            self.log_manager.print_error(f"HIGH ERROR: {error_info.message}")
-        elif error_info.severity == ErrorSeverity.MEDIUM:
-            self.log_manager.print_warning(f"MEDIUM ERROR: {error_info.message}")
-        else:
-            self.log_manager.print_info(f"LOW ERROR: {error_info.message}")
+        log, prefix = self._severity_dispatch[error_info.severity]
+        log(prefix + error_info.message)
         
         if error_info.module_name:
             self.log_manager.print_debug(f"Module: {error_info.module_name}")
         
-        self.log_manager.print_debug(f"Category: {error_info.category.value}")
+        self.log_manager.print_debug(f"Category: {_CATEGORY_NAMES[error_info.category]}")
         
-        if error_info.traceback and self.log_manager.verbose:
-            self.log_manager.print_debug(f"Traceback:\n{error_info.traceback}")
+        if self.log_manager.verbose:
+            if error_info.traceback:
+                self.log_manager.print_debug(f"Traceback:\n{error_info.traceback}")
     
     def _update_error_stats(self, error_info: ErrorInfo):
         """Update error statistics."""
-        self.error_stats['total_errors'] += 1
-        self.error_stats['errors_by_severity'][error_info.severity.value] += 1
-        self.error_stats['errors_by_category'][error_info.category.value] += 1
+        self._severity_counts[error_info.severity] += 1
+        self._category_counts[error_info.category] += 1
     
     def _attempt_recovery(self, error_info: ErrorInfo) -> bool:
         """Attempt to recover from error using available strategies."""
@@ -339,17 +489,20 @@ class ErrorHandler:
         
         # For critical errors, we might want to initiate shutdown
         if not self._attempt_recovery(error_info):
+            self.flush()
             self.log_manager.print_error("Critical error could not be recovered, initiating shutdown...")
             sys.exit(1)
     
     def get_error_summary(self) -> Dict[str, Any]:
         """Get error handling summary."""
+        self.flush()
         return {
-            'total_errors': self.error_stats['total_errors'],
-            'errors_by_severity': self.error_stats['errors_by_severity'],
-            'errors_by_category': self.error_stats['errors_by_category'],
+            'total_errors': sum(self._severity_counts),
+            'errors_by_severity': dict(zip(_SEVERITY_NAMES, self._severity_counts)),
+            'errors_by_category': dict(zip(_CATEGORY_NAMES, self._category_counts)),
             'recovery_attempts': self.error_stats['recovery_attempts'],
             'successful_recoveries': self.error_stats['successful_recoveries'],
+            'suppressed_errors': self._suppressed_errors,
             'recovery_rate': (
                 self.error_stats['successful_recoveries'] / self.error_stats['recovery_attempts']
                 if self.error_stats['recovery_attempts'] > 0 else 0.0
@@ -358,34 +511,53 @@ class ErrorHandler:
                 {
                     'type': error.error_type,
                     'message': error.message,
-                    'severity': error.severity.value,
-                    'category': error.category.value,
+                    'severity': _SEVERITY_NAMES[error.severity],
+                    'category': _CATEGORY_NAMES[error.category],
                     'timestamp': error.timestamp,
                     'module': error.module_name
                 }
-                for error in self.error_history[-10:]  # Last 10 errors
+                for error in itertools.islice(  # Last 10 errors
+                    self.error_history, max(0, len(self.error_history) - 10), None
+                )
             ]
         }
     
     def clear_error_history(self):
         """Clear error history."""
+        self.flush()
         self.error_history.clear()
         self.log_manager.print_debug("Error history cleared")
 
 
+def _drain_queue(pending: "queue.SimpleQueue", timeout: Optional[float]):
+    """Queue a marker and wait for the consumer thread to reach it."""
+    done = threading.Event()
+    pending.put(done)
+    done.wait(timeout)
+
+
 def error_handler(category: ErrorCategory = ErrorCategory.UNKNOWN,
                  severity: ErrorSeverity = ErrorSeverity.MEDIUM,
                  recoverable: bool = True):
     """Decorator for automatic error handling."""
     def decorator(func):
+        # Position of the argument that carried the error handler last time
+        handler_index = None
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            nonlocal handler_index
+            
             # Try to get error handler from context
             error_handler_instance = None
-            for arg in args:
-                if hasattr(arg, 'error_handler'):
-                    error_handler_instance = arg.error_handler
-                    break
+            if handler_index is not None and handler_index < len(args):
+                error_handler_instance = getattr(args[handler_index], 'error_handler', None)
+            if error_handler_instance is None:
+                for index, arg in enumerate(args):
+                    error_handler_instance = getattr(arg, 'error_handler', None)
+                    if error_handler_instance is not None:
+                        handler_index = index
+                        break
             
             if not error_handler_instance:
                 # Fallback to default error handling
@@ -431,35 +603,26 @@ class SafeExecutor:
     
     def execute_with_timeout(self, func: Callable, timeout: float, *args, **kwargs) -> tuple[bool, Any]:
         """Execute function with timeout."""
-        import threading
-        import queue
-        
-        result_queue = queue.Queue()
-        exception_queue = queue.Queue()
+        # A fresh daemon thread per call: a timed-out call cannot be stopped,
+        # and this way it never holds up later calls or interpreter exit
+        future: Future = Future()
         
         def target():
+            future.set_running_or_notify_cancel()
             try:
-                result = func(*args, **kwargs)
-                result_queue.put(result)
+                future.set_result(func(*args, **kwargs))
             except Exception as e:
-                exception_queue.put(e)
+                future.set_exception(e)
         
-        thread = threading.Thread(target=target, daemon=True)
-        thread.start()
-        thread.join(timeout=timeout)
+        threading.Thread(target=target, name="pymba-safe", daemon=True).start()
         
-        if thread.is_alive():
+        try:
+            return True, future.result(timeout=timeout)
+        except FutureTimeoutError:
             # Timeout occurred
             error = TimeoutError(f"Function {func.__name__} timed out after {timeout} seconds")
             self.error_handler.handle_error(error, ErrorCategory.TIMEOUT, ErrorSeverity.HIGH)
             return False, None
-        
-        if not exception_queue.empty():
-            error = exception_queue.get()
+        except Exception as error:
             success = self.error_handler.handle_error(error, ErrorCategory.MODULE, ErrorSeverity.MEDIUM)
             return success, None
-        
-        if not result_queue.empty():
-            return True, result_queue.get()
-        
-        return False, None
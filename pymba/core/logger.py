@@ -10,7 +10,9 @@ import os
 import sys
 import logging
 import threading
-from datetime import datetime
+import weakref
+import time
+import re
 from pathlib import Path
 from typing import Optional, Any, Dict
 from rich.console import Console
@@ -20,6 +22,45 @@ from rich.panel import Panel
 from rich.text import Text
 
 
+# Console-only lines are written once this many are buffered, or after
+# CONSOLE_FLUSH_INTERVAL seconds, whichever comes first
+CONSOLE_BATCH_SIZE = 64
+CONSOLE_FLUSH_INTERVAL = 0.1
+
+# ANSI escape sequences removed by strip_color_tags
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+
+def _write_console_lines(console: Console, buffer: list, lock: threading.Lock):
+    """Print and clear buffered console-only lines."""
+    with lock:
+        if not buffer:
+            return
+        text = "\n".join(buffer)
+        buffer.clear()
+        console.print(text)
+
+
+def _flush_console_loop(console: Console, buffer: list, lock: threading.Lock,
+                        due: threading.Event, closed: threading.Event):
+    """Write each batch CONSOLE_FLUSH_INTERVAL seconds after its first line."""
+    # Takes the logger's parts rather than the logger, so it can still be collected
+    while True:
+        due.wait()
+        due.clear()
+        if closed.wait(CONSOLE_FLUSH_INTERVAL):
+            return
+        _write_console_lines(console, buffer, lock)
+
+
+def _close_console(console: Console, buffer: list, lock: threading.Lock,
+                   due: threading.Event, closed: threading.Event):
+    """Stop the flusher thread and write what is left."""
+    closed.set()
+    due.set()
+    _write_console_lines(console, buffer, lock)
+
+
 class PymbaLogger:
     """Enhanced logging system for Pymba with rich console output."""
     
@@ -30,6 +71,16 @@ class PymbaLogger:
         # Setup console for rich output
         self.console = Console()
         
+        # Console-only (no_log) lines are batched into a single print, whatever
+        # is left is written when the logger is collected or at exit
+        self._console_buffer: list = []
+        self._console_lock = threading.Lock()
+        self._console_due = threading.Event()
+        self._console_closed = threading.Event()
+        self._console_flusher: Optional[threading.Thread] = None
+        weakref.finalize(self, _close_console, self.console, self._console_buffer,
+                         self._console_lock, self._console_due, self._console_closed)
+        
         # Main log file
         self.main_log_file = self.log_dir / "pymba.log"
         self.error_log_file = self.log_dir / "pymba_error.log"
@@ -43,8 +94,10 @@ class PymbaLogger:
         # Setup logging
         self._setup_logging()
         
-        # Progress tracking
-        self._progress_lock = threading.Lock()
+        # (second, formatted) pair so strftime runs at most once per second
+        self._ts_cache = (-1, "")
+        
+        # Progress tracking, only driven from the main thread so it needs no lock
         self._active_progress: Optional[Progress] = None
     
     def _setup_logging(self):
@@ -62,21 +115,21 @@ class PymbaLogger:
         # Clear any existing handlers
         self.logger.handlers.clear()
         
-        # File handler for main log
-        file_handler = logging.FileHandler(self.main_log_file)
+        # File handler for main log (delay=True: files open on first emit)
+        file_handler = logging.FileHandler(self.main_log_file, delay=True)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(file_formatter)
         self.logger.addHandler(file_handler)
         
         # File handler for errors
-        error_handler = logging.FileHandler(self.error_log_file)
+        error_handler = logging.FileHandler(self.error_log_file, delay=True)
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
         self.logger.addHandler(error_handler)
         
         # Module-specific file handler
         if self.module_log_file:
-            module_handler = logging.FileHandler(self.module_log_file)
+            module_handler = logging.FileHandler(self.module_log_file, delay=True)
             module_handler.setLevel(logging.DEBUG)
             module_handler.setFormatter(file_formatter)
             self.logger.addHandler(module_handler)
@@ -92,52 +145,65 @@ class PymbaLogger:
         console_handler.setFormatter(console_formatter)
         self.logger.addHandler(console_handler)
     
+    def _format_second(self, second: int) -> str:
+        """Format a whole-second timestamp, reusing the last result."""
+        cached_second, formatted = self._ts_cache
+        if second != cached_second:
+            formatted = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            self._ts_cache = (second, formatted)
+        return formatted
+    
     def info(self, message: str, no_log: bool = False):
         """Log info message."""
         if not no_log:
+            self.flush_console()
             self.logger.info(message)
         else:
             # Only output to console, not to file
-            self.console.print(f"[blue]INFO[/blue]: {message}")
+            self._console_print(f"[blue]INFO[/blue]: {message}")
     
     def warning(self, message: str, no_log: bool = False):
         """Log warning message."""
         if not no_log:
+            self.flush_console()
             self.logger.warning(message)
         else:
-            self.console.print(f"[yellow]WARNING[/yellow]: {message}")
+            self._console_print(f"[yellow]WARNING[/yellow]: {message}")
     
     def error(self, message: str, no_log: bool = False):
         """Log error message."""
         if not no_log:
+            self.flush_console()
             self.logger.error(message)
         else:
-            self.console.print(f"[red]ERROR[/red]: {message}")
+            self._console_print(f"[red]ERROR[/red]: {message}")
     
     def debug(self, message: str, no_log: bool = False):
         """Log debug message."""
         if not no_log:
+            self.flush_console()
             self.logger.debug(message)
         else:
-            self.console.print(f"[dim]DEBUG[/dim]: {message}")
+            self._console_print(f"[dim]DEBUG[/dim]: {message}")
     
     def success(self, message: str, no_log: bool = False):
         """Log success message."""
         formatted_message = f"[green]SUCCESS[/green]: {message}"
         if not no_log:
+            self.flush_console()
             self.logger.info(formatted_message)
         else:
-            self.console.print(formatted_message)
+            self._console_print(formatted_message)
     
     def print_output(self, message: str, log_type: str = "main"):
         """Print output with formatting (compatible with EMBA style)."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self.print_date()
         
         if log_type == "main":
             formatted = f"[{timestamp}] {message}"
             self.info(formatted)
         elif log_type == "no_log":
-            self.console.print(message)
+            self._console_print(message)
         else:
             formatted = f"[{timestamp}] [{log_type}] {message}"
             self.info(formatted)
@@ -146,17 +212,45 @@ class PymbaLogger:
         """Print a separator bar."""
         bar = "=" * 65
         if no_log:
-            self.console.print(bar)
+            self._console_print(bar)
         else:
             self.info(bar)
     
     def print_ln(self, no_log: bool = False):
         """Print a new line."""
         if no_log:
-            self.console.print()
+            self._console_print("")
         else:
             self.info("")
     
+    def _console_print(self, text: str):
+        """Queue a console-only line, writing the batch once it is full or due."""
+        with self._console_lock:
+            self._console_buffer.append(text)
+            if len(self._console_buffer) < CONSOLE_BATCH_SIZE:
+                # The first line of a batch bounds how long the batch can wait
+                if len(self._console_buffer) == 1:
+                    self._start_console_flusher()
+                    self._console_due.set()
+                return
+        self.flush_console()
+    
+    def _start_console_flusher(self):
+        """Start the flusher thread unless it is running (it is not after fork)."""
+        if self._console_flusher is not None and self._console_flusher.is_alive():
+            return
+        self._console_flusher = threading.Thread(
+            target=_flush_console_loop,
+            args=(self.console, self._console_buffer, self._console_lock,
+                  self._console_due, self._console_closed),
+            name="pymba-console", daemon=True
+        )
+        self._console_flusher.start()
+    
+    def flush_console(self):
+        """Write any buffered console-only lines."""
+        _write_console_lines(self.console, self._console_buffer, self._console_lock)
+    
     def indent(self, text: str, level: int = 1) -> str:
         """Indent text for formatting."""
         indent_str = "    " * level
@@ -164,7 +258,7 @@ class PymbaLogger:
     
     def print_date(self) -> str:
         """Get formatted current date/time."""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return self._format_second(int(time.time()))
     
     def module_start_log(self, module_name: str):
         """Log module start."""
@@ -180,23 +274,22 @@ class PymbaLogger:
     
     def start_progress(self, description: str):
         """Start a progress indicator."""
-        with self._progress_lock:
-            if self._active_progress:
-                self._active_progress.stop()
-            
-            self._active_progress = Progress(
-                SpinnerColumn(),
-                TextColumn(f"[blue]{description}[/blue]"),
-                console=self.console
-            )
-            self._active_progress.start()
+        self.flush_console()
+        if self._active_progress:
+            self._active_progress.stop()
+        
+        self._active_progress = Progress(
+            SpinnerColumn(),
+            TextColumn(f"[blue]{description}[/blue]"),
+            console=self.console
+        )
+        self._active_progress.start()
     
     def stop_progress(self):
         """Stop the progress indicator."""
-        with self._progress_lock:
-            if self._active_progress:
-                self._active_progress.stop()
-                self._active_progress = None
+        if self._active_progress:
+            self._active_progress.stop()
+            self._active_progress = None
     
     def print_firmware_info(self, vendor: str, version: str, device: str, notes: str):
         """Print firmware information."""
@@ -208,6 +301,7 @@ class PymbaLogger:
             title="Firmware Information",
             border_style="blue"
         )
+        self.flush_console()
         self.console.print(info_panel)
     
     def write_notification(self, message: str):
@@ -216,9 +310,10 @@ class PymbaLogger:
     
     def strip_color_tags(self, text: str) -> str:
         """Strip ANSI color codes from text."""
-        import re
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        # Most text has no escapes at all, a substring scan avoids the regex
+        if '\x1b' not in text:
+            return text
+        return _ANSI_ESCAPE_RE.sub('', text)
     
     def orange(self, text: str) -> str:
         """Format text in orange color."""
@@ -9,18 +9,26 @@ from EMBA.
 
 import os
 import sys
+import json
+import re
+import pickle
+import tempfile
 import importlib
-import inspect
 import threading
 import time
+import multiprocessing
 from pathlib import Path
-from typing import Dict, List, Optional, Type, Any, Callable
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Type, Any, Callable, FrozenSet
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
+from collections import Counter
 
+from .. import __version__
 from ..helpers.logging_utils import LogManager
 from ..helpers.system_utils import get_cpu_count
+from ..helpers.dataclass_utils import with_slots
+from .base_module import cleanup_tmpfs_dirs
 
 
 class ModuleCategory(Enum):
@@ -33,16 +41,42 @@ class ModuleCategory(Enum):
     D = "Differential Analysis"
 
 
-class ModuleStatus(Enum):
+class ModuleStatus(IntEnum):
     """Module execution status."""
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    SKIPPED = "skipped"
+    PENDING = 0
+    RUNNING = 1
+    COMPLETED = 2
+    FAILED = 3
+    SKIPPED = 4
 
 
-@dataclass
+# Forked workers share the parent's loaded modules and config copy-on-write
+_FORK_CONTEXT = (multiprocessing.get_context("fork")
+                 if "fork" in multiprocessing.get_all_start_methods() else None)
+
+# Manager whose modules the forked workers execute, inherited through fork
+_worker_manager = None
+
+
+def _run_module_in_worker(module_name: str) -> "ModuleResult":
+    """Execute a module in a forked worker process."""
+    try:
+        return _worker_manager.execute_module(module_name)
+    finally:
+        # Workers leave through os._exit, which skips atexit and finalizers
+        _worker_manager._flush_output()
+        cleanup_tmpfs_dirs()
+
+
+# Module names: category letter, two-digit priority, underscore (e.g. P02_...)
+_MODULE_NAME_RE = re.compile(r'^([PSLFQD])(\d{2})_', re.IGNORECASE)
+
+# Module file names, the same prefix on a non-dunder .py file (e.g. p02_foo.py)
+_MODULE_FILE_RE = re.compile(r'^(?!__)([PSLFQD])(\d{2})_[^.]+\.py$', re.IGNORECASE)
+
+
+@with_slots
+@dataclass(frozen=True)
 class ModuleInfo:
     """Information about a module."""
     name: str
@@ -56,9 +90,36 @@ class ModuleInfo:
     description: str
 
 
+@with_slots
+@dataclass(frozen=True)
+class _RunConfig:
+    """Config settings the manager reads, captured once per config."""
+    max_parallel_modules: int
+    max_threads_per_module: int
+    use_multiprocessing: bool
+    module_blacklist: FrozenSet[str]
+    eager_discovery: bool
+    module_cache_enabled: bool
+    
+    @classmethod
+    def from_config(cls, config: Any) -> "_RunConfig":
+        """Snapshot the relevant settings of a config object (or None)."""
+        return cls(
+            max_parallel_modules=getattr(config, 'max_parallel_modules', 4),
+            max_threads_per_module=getattr(config, 'max_threads_per_module', 2),
+            use_multiprocessing=getattr(config, 'use_multiprocessing', False),
+            module_blacklist=frozenset(getattr(config, 'module_blacklist', None) or ()),
+            eager_discovery=getattr(config, 'eager_discovery', False),
+            module_cache_enabled=getattr(config, 'module_cache_enabled', True)
+        )
+
+
 class ModuleResult:
     """Result of module execution."""
     
+    __slots__ = ('module_name', 'status', 'exit_code', 'output', 'error',
+                 'duration', 'start_time', 'end_time', 'thread_id')
+    
     def __init__(self, module_name: str, status: ModuleStatus, 
                  exit_code: int = 0, output: str = "", error: str = "", 
                  duration: float = 0.0):
@@ -73,22 +134,47 @@ class ModuleResult:
         self.thread_id = None
 
 
+# Bumped whenever the pickled layout of the module metadata cache changes
+_MODULE_CACHE_FORMAT = 2
+
+
+def _cache_path(filename: str) -> str:
+    """Get the path of a file in the pymba cache directory."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    return os.path.join(cache_home, 'pymba', filename)
+
+
+class _LazyModuleEntry:
+    """Placeholder for a discovered module that has not been imported yet."""
+    
+    __slots__ = ('path', 'file')
+    
+    def __init__(self, path: Path, file: Path):
+        self.path = path
+        self.file = file
+
+
 class ModuleManager:
     """Manages loading and execution of analysis modules."""
     
     def __init__(self, log_manager: LogManager, config: Any):
         self.log_manager = log_manager
-        self.config = config
         
-        # Module registry
-        self.modules: Dict[str, Type] = {}
+        # Module registry, entries are imported on first use unless discovery is eager
+        self.modules: Dict[str, Any] = {}
         self.module_info: Dict[str, ModuleInfo] = {}
         self.module_results: Dict[str, ModuleResult] = {}
         
-        # Execution control
-        self.max_parallel_modules = getattr(config, 'max_parallel_modules', 4)
-        self.max_threads_per_module = getattr(config, 'max_threads_per_module', 2)
-        self.use_multiprocessing = getattr(config, 'use_multiprocessing', False)
+        # Where each discovered module was found, used to cache discovery results
+        self._module_sources: Dict[str, _LazyModuleEntry] = {}
+        
+        # list_modules results by (category, blacklist) and module names per category
+        # in priority order, both dropped whenever module_info changes
+        self._list_cache: Dict[tuple, List[str]] = {}
+        self._by_category_sorted: Optional[Dict[ModuleCategory, tuple]] = None
+        
+        # Snapshots the execution settings, see refresh_config()
+        self.config = config
         
         # Module paths
         self.module_paths = {
@@ -100,26 +186,108 @@ class ModuleManager:
             ModuleCategory.D: Path(__file__).parent.parent / "modules" / "d_modules"
         }
         
+        # Add pymba root to Python path once, module imports rely on it
+        self._pymba_root = str(Path(__file__).parent.parent.parent)
+        if self._pymba_root not in sys.path:
+            sys.path.insert(0, self._pymba_root)
+        
         # Execution state
         self._execution_lock = threading.Lock()
         self._running_modules: Dict[str, threading.Thread] = {}
         
+        # Durations recorded by earlier runs, loaded on first use
+        self._known_durations: Optional[Dict[str, float]] = None
+        
+    @property
+    def config(self) -> Any:
+        """Configuration the manager runs modules with."""
+        return self._config
+    
+    @config.setter
+    def config(self, config: Any):
+        """Set the configuration and snapshot the settings used for execution."""
+        self._config = config
+        self.refresh_config()
+    
+    def refresh_config(self):
+        """Re-read execution settings after the config was changed in place."""
+        self._rc = _RunConfig.from_config(self._config)
+        self._invalidate_listings()
+    
     def discover_modules(self) -> Dict[str, ModuleInfo]:
         """Discover all available modules in the module directories."""
         self.log_manager.info("Discovering available modules...")
         
+        eager = self._rc.eager_discovery
+        use_cache = self._rc.module_cache_enabled
+        
+        if use_cache:
+            fingerprint = self._module_fingerprint(eager)
+            cache_file = _cache_path('modules.pkl')
+            try:
+                with open(cache_file, 'rb') as f:
+                    cache = pickle.load(f)
+                if cache.get('fingerprint') == fingerprint and self.load_from_cache(cache):
+                    self.log_manager.debug(f"Using module cache: {cache_file}")
+                    return dict(cache['module_info'])
+            except Exception:
+                # Missing, stale or unreadable cache - fall back to discovery
+                pass
+        
+        if eager:
+            discovered_modules = self._discover_modules_eager()
+        else:
+            discovered_modules = self._discover_modules_lazy()
+        self._invalidate_listings()
+        
+        if use_cache:
+            cache = self.get_discovery_cache()
+            cache['fingerprint'] = fingerprint
+            self._write_metadata_cache(cache_file, cache)
+        
+        return discovered_modules
+    
+    def _module_fingerprint(self, eager: bool) -> tuple:
+        """Fingerprint the module files by name, mtime and size."""
+        entries = []
+        for module_path in self.module_paths.values():
+            try:
+                with os.scandir(module_path) as it:
+                    for entry in it:
+                        if entry.name.endswith('.py'):
+                            st = entry.stat()
+                            entries.append((entry.path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                continue
+        return (__version__, _MODULE_CACHE_FORMAT, eager, tuple(sorted(entries)))
+    
+    def _write_metadata_cache(self, cache_file: str, cache: Dict[str, Any]):
+        """Atomically replace the module metadata cache."""
+        try:
+            cache_dir = os.path.dirname(cache_file)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_file, cache_file)
+            except BaseException:
+                os.unlink(temp_file)
+                raise
+        except Exception as e:
+            self.log_manager.debug(f"Failed to write module cache: {e}")
+    
+    def _discover_modules_eager(self) -> Dict[str, ModuleInfo]:
+        """Import every module file and extract its metadata."""
         discovered_modules = {}
         
         for category, module_path in self.module_paths.items():
-            if not module_path.exists():
-                self.log_manager.warning(f"Module path does not exist: {module_path}")
-                continue
-            
             # Look for Python module files
-            for module_file in module_path.glob("*.py"):
-                if module_file.name.startswith("__"):
+            for file_name in self._list_module_dir(module_path):
+                if not file_name.endswith('.py') or file_name.startswith('__'):
                     continue
                 
+                module_file = module_path / file_name
                 module_name = module_file.stem
                 
                 try:
@@ -133,6 +301,7 @@ class ModuleManager:
                         discovered_modules[class_name] = module_info
                         self.modules[class_name] = module_class
                         self.module_info[class_name] = module_info
+                        self._module_sources[class_name] = _LazyModuleEntry(module_path, module_file)
                         
                         self.log_manager.debug(f"Discovered module: {class_name}")
                 
@@ -142,26 +311,103 @@ class ModuleManager:
         self.log_manager.success(f"Discovered {len(discovered_modules)} modules")
         return discovered_modules
     
+    def _discover_modules_lazy(self) -> Dict[str, ModuleInfo]:
+        """Register modules from their file names without importing them."""
+        discovered_modules = {}
+        
+        for category, module_path in self.module_paths.items():
+            for file_name in self._list_module_dir(module_path):
+                match = _MODULE_FILE_RE.match(file_name)
+                if not match:
+                    continue
+                
+                # Module classes are named after their file (p02_foo.py -> P02_foo).
+                # Only name, category and priority are known until the module is
+                # resolved, get_module_info() and the execute methods resolve it.
+                module_file = module_path / file_name
+                stem = file_name[:-3]
+                class_name = stem[0].upper() + stem[1:]
+                module_info = ModuleInfo(
+                    name=class_name,
+                    category=category,
+                    priority=int(match.group(2)),
+                    dependencies=[],
+                    can_run_parallel=True,
+                    max_threads=1,
+                    timeout=None,
+                    enabled=True,
+                    description=""
+                )
+                discovered_modules[class_name] = module_info
+                self.modules[class_name] = _LazyModuleEntry(module_path, module_file)
+                self.module_info[class_name] = module_info
+                self._module_sources[class_name] = self.modules[class_name]
+                
+                self.log_manager.debug(f"Discovered module: {class_name}")
+        
+        self.log_manager.success(f"Discovered {len(discovered_modules)} modules")
+        return discovered_modules
+    
+    def _list_module_dir(self, module_path: Path) -> List[str]:
+        """List the regular files in a module directory with one scandir pass."""
+        try:
+            with os.scandir(module_path) as it:
+                return [entry.name for entry in it if entry.is_file()]
+        except FileNotFoundError:
+            self.log_manager.warning(f"Module path does not exist: {module_path}")
+            return []
+    
+    def _resolve_module(self, name: str) -> Optional[Type]:
+        """Import a lazily discovered module and complete its ModuleInfo."""
+        entry = self.modules.get(name)
+        if not isinstance(entry, _LazyModuleEntry):
+            return entry
+        
+        module_class = self._load_module_class(entry.path, entry.file)
+        if module_class is None:
+            self.log_manager.warning(f"Failed to load module {entry.file.stem}")
+            return None
+        
+        # Replace the placeholder with the class and the full metadata
+        self.module_info[name] = self._extract_module_info(
+            module_class, self.module_info[name].category, name
+        )
+        self.modules[name] = module_class
+        self._invalidate_listings()
+        return module_class
+    
+    def _resolve_modules(self, module_names: List[str]):
+        """Import every lazily discovered module in the list."""
+        for name in module_names:
+            if isinstance(self.modules.get(name), _LazyModuleEntry):
+                self._resolve_module(name)
+    
     def _load_module_class(self, module_path: Path, module_file: Path) -> Optional[Type]:
         """Load a module class from a Python file."""
         try:
-            # Add pymba root to Python path
-            pymba_root = str(module_path.parent.parent.parent)
-            if pymba_root not in sys.path:
-                sys.path.insert(0, pymba_root)
-            
             # Import the module using correct path
             module_name = f"pymba.modules.{module_path.name}.{module_file.stem}"
             module = importlib.import_module(module_name)
             
-            # Find the module class (should be the main class in the module)
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                # Look for classes that have a 'run' method and are defined in this module
-                # Skip base classes and imported classes
-                if (hasattr(obj, 'run') and 
-                    obj.__module__ == module_name and
-                    not name.startswith('Base') and
-                    name != 'Path'):
+            def is_module_class(name: str, obj: Any) -> bool:
+                # Classes with a 'run' method defined in this module, imported
+                # classes and base classes are skipped before touching the MRO
+                return (isinstance(obj, type) and
+                        obj.__module__ == module_name and
+                        not name.startswith('Base') and
+                        name != 'Path' and
+                        getattr(obj, 'run', None) is not None)
+            
+            # The main class is named after its file (p02_foo.py -> P02_foo)
+            stem = module_file.stem
+            expected_name = stem[0].upper() + stem[1:]
+            obj = vars(module).get(expected_name)
+            if is_module_class(expected_name, obj):
+                return obj
+            
+            # Otherwise the first candidate by name, as before
+            for name, obj in sorted(vars(module).items()):
+                if is_module_class(name, obj):
                     return obj
             
             return None
@@ -199,8 +445,9 @@ class ModuleManager:
             description = module_class.__doc__.strip().split('\n')[0]
         
         # Extract from module number in name (e.g., P02, S10)
-        if full_name[1:].isdigit():
-            priority = int(full_name[1:])
+        match = _MODULE_NAME_RE.match(full_name)
+        if match:
+            priority = int(match.group(2))
         
         return ModuleInfo(
             name=full_name,
@@ -214,31 +461,85 @@ class ModuleManager:
             description=description
         )
     
+    def get_discovery_cache(self) -> Dict[str, Any]:
+        """Get the discovered module registry in a picklable form."""
+        # Classes are stored by location so loading the cache imports nothing
+        return {
+            'modules': dict(self._module_sources),
+            'module_info': {name: self.module_info[name] for name in self._module_sources}
+        }
+    
+    def load_from_cache(self, cache: Dict[str, Any]) -> bool:
+        """Populate the module registry from a previous discovery result."""
+        modules = cache.get('modules')
+        module_info = cache.get('module_info')
+        if not modules or not module_info:
+            return False
+        
+        self.modules.update(modules)
+        self.module_info.update(module_info)
+        self._invalidate_listings()
+        self._module_sources.update(
+            (name, entry) for name, entry in modules.items()
+            if isinstance(entry, _LazyModuleEntry)
+        )
+        self.log_manager.success(f"Loaded {len(module_info)} modules from cache")
+        return True
+    
     def register_module(self, name: str, module_class: Type, module_info: ModuleInfo):
         """Register a module manually."""
         self.modules[name] = module_class
         self.module_info[name] = module_info
+        self._invalidate_listings()
         self.log_manager.debug(f"Registered module: {name}")
     
     def get_module(self, name: str) -> Optional[Type]:
         """Get a module class by name."""
-        return self.modules.get(name)
+        return self._resolve_module(name)
     
     def get_module_info(self, name: str) -> Optional[ModuleInfo]:
-        """Get module information by name."""
+        """Get module information by name, importing a lazily discovered module."""
+        # Placeholders only know the name, category and priority; dependencies,
+        # can_run_parallel and the rest come from the module class
+        if isinstance(self.modules.get(name), _LazyModuleEntry):
+            self._resolve_module(name)
         return self.module_info.get(name)
     
+    def _invalidate_listings(self):
+        """Drop the cached module listings after module_info changed."""
+        self._list_cache.clear()
+        self._by_category_sorted = None
+    
+    def _modules_by_priority(self, category: ModuleCategory) -> tuple:
+        """Get all module names of a category sorted by priority."""
+        if self._by_category_sorted is None:
+            by_category: Dict[ModuleCategory, list] = {cat: [] for cat in ModuleCategory}
+            for name, info in self.module_info.items():
+                by_category[info.category].append(name)
+            self._by_category_sorted = {
+                cat: tuple(sorted(names, key=lambda name: self.module_info[name].priority))
+                for cat, names in by_category.items()
+            }
+        return self._by_category_sorted[category]
+    
     def list_modules(self, category: Optional[ModuleCategory] = None) -> List[str]:
         """List available modules, optionally filtered by category."""
-        blacklist = getattr(self.config, 'module_blacklist', [])
-        
-        if category:
-            result = [name for name, info in self.module_info.items() 
-                     if info.category == category and info.enabled and name not in blacklist]
-            self.log_manager.debug(f"list_modules({category.name}): found {len(result)} modules, blacklist={blacklist}")
-            return result
-        return [name for name, info in self.module_info.items() 
-               if info.enabled and name not in blacklist]
+        blacklist = self._rc.module_blacklist
+        key = (category, blacklist)
+        
+        result = self._list_cache.get(key)
+        if result is None:
+            if category:
+                result = [name for name, info in self.module_info.items() 
+                         if info.category == category and info.enabled and name not in blacklist]
+                self.log_manager.debug(f"list_modules({category.name}): found {len(result)} modules, blacklist={sorted(blacklist)}")
+            else:
+                result = [name for name, info in self.module_info.items() 
+                         if info.enabled and name not in blacklist]
+            self._list_cache[key] = result
+        
+        # Callers may sort or extend the list they get back
+        return list(result)
     
     def execute_module(self, module_name: str, **kwargs) -> ModuleResult:
         """Execute a single module."""
@@ -248,7 +549,12 @@ class ModuleManager:
                 error=f"Module {module_name} not found"
             )
         
-        module_class = self.modules[module_name]
+        module_class = self._resolve_module(module_name)
+        if module_class is None:
+            return ModuleResult(
+                module_name, ModuleStatus.FAILED,
+                error=f"Failed to load module {module_name}"
+            )
         module_info = self.module_info[module_name]
         
         self.log_manager.info(f"Executing module: {module_name}")
@@ -297,6 +603,9 @@ class ModuleManager:
         if not module_names:
             return {}
         
+        # Dependencies and the enabled flag are only known once a module is imported
+        self._resolve_modules(module_names)
+        
         # Filter to only enabled modules
         enabled_modules = [name for name in module_names 
                           if name in self.module_info and self.module_info[name].enabled]
@@ -307,81 +616,217 @@ class ModuleManager:
         
         self.log_manager.info(f"Executing {len(enabled_modules)} modules in parallel")
         
-        # Determine execution strategy
-        if self.use_multiprocessing:
-            return self._execute_modules_multiprocess(enabled_modules, max_workers)
+        # Determine execution strategy. Forking with other threads running can
+        # deadlock the child, so processes are only used from the main thread.
+        use_processes = self._rc.use_multiprocessing and _FORK_CONTEXT is not None
+        if use_processes and threading.current_thread() is not threading.main_thread():
+            self.log_manager.debug("Not forking outside the main thread, using threads")
+            use_processes = False
+        
+        if use_processes:
+            results = self._execute_modules_multiprocess(enabled_modules, max_workers)
         else:
-            return self._execute_modules_multithread(enabled_modules, max_workers)
+            results = self._execute_modules_multithread(enabled_modules, max_workers)
+        
+        self.save_durations()
+        return results
+    
+    def _compute_levels(self, module_names: List[str]) -> List[List[str]]:
+        """Group modules into dependency levels (Kahn's algorithm)."""
+        selected = set(module_names)
+        in_degree = {name: 0 for name in module_names}
+        successors: Dict[str, List[str]] = {name: [] for name in module_names}
+        
+        # Only dependencies within the submitted set constrain the order
+        for name in module_names:
+            for dependency in self.module_info[name].dependencies:
+                if dependency in selected and dependency != name:
+                    in_degree[name] += 1
+                    successors[dependency].append(name)
+        
+        levels = []
+        level = [name for name in module_names if in_degree[name] == 0]
+        while level:
+            levels.append(level)
+            next_level = []
+            for name in level:
+                for successor in successors[name]:
+                    in_degree[successor] -= 1
+                    if in_degree[successor] == 0:
+                        next_level.append(successor)
+            level = next_level
+        
+        # Upward rank: own expected duration plus the longest chain of dependents.
+        # Levels are in topological order, so walk them backwards.
+        ranks: Dict[str, float] = {}
+        for level in reversed(levels):
+            for name in level:
+                ranks[name] = self._expected_duration(name) + max(
+                    (ranks[successor] for successor in successors[name]), default=0.0
+                )
+        
+        # Start the longest critical paths first, priority order breaks ties
+        for level in levels:
+            level.sort(key=lambda name: -ranks[name])
+        
+        return levels
+    
+    def _expected_duration(self, module_name: str) -> float:
+        """Estimate a module's duration from this or earlier runs."""
+        result = self.module_results.get(module_name)
+        if result and result.duration:
+            return result.duration
+        return self._load_durations().get(module_name, 1.0)
+    
+    def _load_durations(self) -> Dict[str, float]:
+        """Load module durations recorded by earlier runs."""
+        if self._known_durations is None:
+            try:
+                with open(_cache_path('module_durations.json'), 'r') as f:
+                    data = json.load(f)
+                self._known_durations = {
+                    name: float(duration) for name, duration in data.items()
+                }
+            except (OSError, ValueError, TypeError, AttributeError):
+                self._known_durations = {}
+        return self._known_durations
+    
+    def save_durations(self):
+        """Record the durations of executed modules for future scheduling."""
+        durations = self._load_durations()
+        durations.update({
+            name: result.duration for name, result in self.module_results.items()
+            if result.duration
+        })
+        if not durations:
+            return
+        
+        durations_file = _cache_path('module_durations.json')
+        try:
+            os.makedirs(os.path.dirname(durations_file), exist_ok=True)
+            temp_file = durations_file + '.tmp'
+            with open(temp_file, 'w') as f:
+                json.dump(durations, f)
+            os.replace(temp_file, durations_file)
+        except OSError as e:
+            self.log_manager.debug(f"Failed to save module durations: {e}")
+    
+    def _execute_levels(self, executor, submit: Callable, levels: List[List[str]],
+                        results: Dict[str, ModuleResult]):
+        """Run each level as a parallel batch, waiting for it before the next."""
+        for level in levels:
+            runnable = []
+            for name in level:
+                # Earlier levels hold every dependency from the submitted set
+                failed = [dep for dep in self.module_info[name].dependencies
+                          if dep in results and results[dep].status != ModuleStatus.COMPLETED]
+                if failed:
+                    self.log_manager.warning(f"Skipping module {name}, dependencies did not complete: {', '.join(failed)}")
+                    result = ModuleResult(
+                        name, ModuleStatus.SKIPPED,
+                        error=f"Dependencies did not complete: {', '.join(failed)}"
+                    )
+                    results[name] = result
+                    self.module_results[name] = result
+                else:
+                    runnable.append(name)
+            
+            future_to_module = {
+                executor.submit(submit, name): name 
+                for name in runnable
+            }
+            
+            # Collect results as they complete
+            pending = set(future_to_module)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    module_name = future_to_module[future]
+                    error = future.exception()
+                    if error is None:
+                        result = future.result()
+                        results[module_name] = result
+                        # Results from worker processes are not seen by the parent otherwise
+                        self.module_results[module_name] = result
+                        self.log_manager.debug(f"Module {module_name} completed with status: {result.status.name.lower()}")
+                    else:
+                        result = ModuleResult(
+                            module_name, ModuleStatus.FAILED,
+                            error=f"Execution failed: {error}"
+                        )
+                        results[module_name] = result
+                        self.module_results[module_name] = result
+    
+    def _schedule(self, module_names: List[str], 
+                  results: Dict[str, ModuleResult]) -> List[List[str]]:
+        """Compute dependency levels, failing modules caught in a cycle."""
+        levels = self._compute_levels(module_names)
+        
+        scheduled = sum(len(level) for level in levels)
+        if scheduled != len(module_names):
+            leveled = {name for level in levels for name in level}
+            cyclic = [name for name in module_names if name not in leveled]
+            self.log_manager.error(f"Dependency cycle between modules: {', '.join(cyclic)}")
+            for name in cyclic:
+                result = ModuleResult(
+                    name, ModuleStatus.FAILED,
+                    error="Dependency cycle detected"
+                )
+                results[name] = result
+                self.module_results[name] = result
+        
+        return levels
     
     def _execute_modules_multithread(self, module_names: List[str], 
                                    max_workers: Optional[int] = None) -> Dict[str, ModuleResult]:
         """Execute modules using threading."""
-        if max_workers is None:
-            max_workers = min(self.max_parallel_modules, len(module_names))
-        
         results = {}
+        levels = self._schedule(module_names, results)
+        if not levels:
+            return results
+        
+        if max_workers is None:
+            max_workers = min(self._rc.max_parallel_modules, max(len(level) for level in levels))
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all modules
-            future_to_module = {
-                executor.submit(self.execute_module, name): name 
-                for name in module_names
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_module):
-                module_name = future_to_module[future]
-                try:
-                    result = future.result()
-                    results[module_name] = result
-                    self.log_manager.debug(f"Module {module_name} completed with status: {result.status}")
-                except Exception as e:
-                    results[module_name] = ModuleResult(
-                        module_name, ModuleStatus.FAILED,
-                        error=f"Execution failed: {e}"
-                    )
+            self._execute_levels(executor, self.execute_module, levels, results)
         
         return results
     
     def _execute_modules_multiprocess(self, module_names: List[str], 
                                     max_workers: Optional[int] = None) -> Dict[str, ModuleResult]:
         """Execute modules using multiprocessing."""
+        results = {}
+        levels = self._schedule(module_names, results)
+        if not levels:
+            return results
+        
         if max_workers is None:
-            max_workers = min(self.max_parallel_modules, len(module_names))
+            max_workers = min(self._rc.max_parallel_modules, max(len(level) for level in levels))
         
-        results = {}
+        global _worker_manager
+        _worker_manager = self
         
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all modules
-            future_to_module = {
-                executor.submit(self._execute_module_process, name): name 
-                for name in module_names
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_module):
-                module_name = future_to_module[future]
-                try:
-                    result = future.result()
-                    results[module_name] = result
-                    self.log_manager.debug(f"Module {module_name} completed with status: {result.status}")
-                except Exception as e:
-                    results[module_name] = ModuleResult(
-                        module_name, ModuleStatus.FAILED,
-                        error=f"Execution failed: {e}"
-                    )
+        # Children would otherwise inherit and print the buffered output again
+        self._flush_output()
+        
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=_FORK_CONTEXT) as executor:
+            self._execute_levels(executor, _run_module_in_worker, levels, results)
         
         return results
     
-    def _execute_module_process(self, module_name: str) -> ModuleResult:
-        """Execute a module in a separate process."""
-        # This would need to be implemented to handle process isolation
-        # For now, fall back to thread execution
-        return self.execute_module(module_name)
+    def _flush_output(self):
+        """Write out buffered console output of the log manager and stdio."""
+        flush_console = getattr(self.log_manager, 'flush_console', None)
+        if flush_console is not None:
+            flush_console()
+        sys.stdout.flush()
+        sys.stderr.flush()
     
     def execute_module_sequence(self, module_names: List[str]) -> Dict[str, ModuleResult]:
         """Execute modules sequentially in order."""
         results = {}
+        self._resolve_modules(module_names)
         
         for module_name in module_names:
             if module_name in self.module_info and not self.module_info[module_name].enabled:
@@ -400,15 +845,11 @@ class ModuleManager:
     
     def get_execution_summary(self) -> Dict[str, Any]:
         """Get summary of module execution results."""
-        if not self.module_results:
-            return {"total": 0, "completed": 0, "failed": 0, "duration": 0.0}
-        
         total = len(self.module_results)
-        completed = sum(1 for r in self.module_results.values() 
-                       if r.status == ModuleStatus.COMPLETED)
-        failed = sum(1 for r in self.module_results.values() 
-                    if r.status == ModuleStatus.FAILED)
-        total_duration = sum(r.duration for r in self.module_results.values())
+        status_counts = Counter(r.status for r in self.module_results.values())
+        completed = status_counts[ModuleStatus.COMPLETED]
+        failed = status_counts[ModuleStatus.FAILED]
+        total_duration = sum((r.duration for r in self.module_results.values()), 0.0)
         
         return {
             "total": total,
@@ -421,7 +862,9 @@ class ModuleManager:
     
     def clear_results(self):
         """Clear all module execution results."""
+        self.save_durations()
         self.module_results.clear()
+        self._invalidate_listings()
     
     def get_module_result(self, module_name: str) -> Optional[ModuleResult]:
         """Get execution result for a specific module."""
@@ -444,15 +887,16 @@ class ModuleManager:
             return []
         
         category_enum = category_map[category]
-        module_names = self.list_modules(category_enum)
+        blacklist = self._rc.module_blacklist
+        
+        # Already sorted by priority
+        module_names = [name for name in self._modules_by_priority(category_enum)
+                        if self.module_info[name].enabled and name not in blacklist]
         
         if not module_names:
             self.log_manager.warning(f"No modules found for category {category}")
             return []
         
-        # Sort modules by priority
-        module_names.sort(key=lambda name: self.module_info[name].priority)
-        
         self.log_manager.info(f"Running {len(module_names)} modules in category {category}")
         
         if threaded:
@@ -462,5 +906,9 @@ class ModuleManager:
             # Run modules sequentially
             results = self.execute_module_sequence(module_names)
         
-        # Return exit codes
-        return [results[name].exit_code for name in module_names if name in results]
\ No newline at end of file
+        # Return exit codes, failed and skipped modules never report success
+        # even when they did not get far enough to set one
+        return [
+            (result.exit_code or 1) if result.status != ModuleStatus.COMPLETED else 0
+            for result in (results[name] for name in module_names if name in results)
+        ]
\ No newline at end of file
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Dataclass utilities for Pymba.
+
+This module provides helpers shared by the configuration dataclasses.
+"""
+
+from dataclasses import fields
+
+
+def with_slots(cls):
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields.
+    
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10+.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # Defaults live in the generated __init__, not on the class
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    
+    # Default unpickling assigns slots with setattr, which frozen instances reject
+    if cls.__dataclass_params__.frozen:
+        cls_dict['__getstate__'] = _slots_getstate
+        cls_dict['__setstate__'] = _slots_setstate
+    
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+def _slots_getstate(self):
+    """Get field values for pickling a slotted dataclass."""
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _slots_setstate(self, state):
+    """Restore field values of a frozen slotted dataclass."""
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
@@ -7,6 +7,7 @@ ported from EMBA's helper functions.
 """
 
 import os
+import mmap
 import hashlib
 import mimetypes
 from pathlib import Path
@@ -53,11 +54,17 @@ def get_file_size(filepath: str) -> int:
 def get_file_hash(filepath: str, algorithm: str = 'sha256') -> Optional[str]:
     """Calculate file hash."""
     try:
-        hash_obj = hashlib.new(algorithm)
         with open(filepath, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_obj.update(chunk)
-        return hash_obj.hexdigest()
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: reusable buffer, GIL released during updates
+                return hashlib.file_digest(f, algorithm).hexdigest()
+            
+            hash_obj = hashlib.new(algorithm)
+            # Hash the whole file in one update call; empty files cannot be mapped
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hash_obj.update(mm)
+            return hash_obj.hexdigest()
     except (OSError, ValueError):
         return None
 
@@ -14,10 +14,145 @@ from typing import Dict, List, Optional, Any
 from .logging_utils import LogManager, Colors
 
 
+_HELP_FLAGS = ('-h', '--help')
+
+# Splits comma-separated option values, stripping blanks around each item
+_split_list = re.compile(r'\s*,\s*').split
+
+# Arguments as plain (flags, add_argument kwargs) data, so ParameterParser
+# only registers the ones that appear on the command line
+_ARGUMENTS = (
+    # Core parameters
+    (('-f', '--firmware'), {'help': 'Firmware file or directory to analyze'}),
+    (('-l', '--log-dir'), {'help': 'Output directory for logs and reports'}),
+    
+    # Architecture
+    (('-a', '--arch'), {'help': 'Target architecture (e.g., mips, arm, x86)'}),
+    (('-A', '--arch-no-check'), {'help': 'Target architecture without verification'}),
+    
+    # Analysis options
+    (('-c', '--extended'), {'action': 'store_true', 'help': 'Extended binary analysis'}),
+    (('-E', '--emulation'), {'action': 'store_true', 'help': 'Enable system emulation'}),
+    (('-F', '--force'), {'action': 'store_true', 'help': 'Force analysis even if issues detected'}),
+    (('-Q', '--quick'), {'action': 'store_true', 'help': 'Quick analysis mode'}),
+    (('-q', '--quiet'), {'action': 'store_true', 'help': 'Quiet mode (minimal output)'}),
+    
+    # Exclusions
+    (('-e', '--exclude'), {'action': 'append',
+                           'help': 'Exclude path from analysis (can be used multiple times)'}),
+    
+    # Kernel
+    (('-k', '--kernel'), {'help': 'Kernel file for analysis'}),
+    
+    # Modules
+    (('-m', '--modules'), {'action': 'append',
+                           'help': 'Specific modules to run (can be used multiple times)'}),
+    
+    # Threading
+    (('-t', '--threads'), {'type': int, 'default': 1,
+                           'help': 'Number of threads for parallel execution'}),
+    
+    # Profiles
+    (('-p', '--profile'), {'help': 'Scan profile to use'}),
+    (('-P', '--scan-profile'), {'help': 'Alternative scan profile parameter'}),
+    
+    # Output formats
+    (('-H', '--html'), {'action': 'store_true', 'help': 'Generate HTML report'}),
+    (('-j', '--json'), {'action': 'store_true', 'help': 'Generate JSON output'}),
+    (('-C', '--csv'), {'action': 'store_true', 'help': 'Generate CSV output'}),
+    
+    # Docker options
+    (('-D', '--no-docker'), {'action': 'store_true', 'help': 'Run without Docker (development mode)'}),
+    (('--container',), {'help': 'Docker container ID for extraction'}),
+    
+    # Dependency check
+    (('-d', '--dep-check'), {'type': int, 'choices': [1, 2],
+                             'help': 'Dependency check mode (1=host+container, 2=container only)'}),
+    
+    # Reset and cleanup
+    (('-r', '--reset'), {'action': 'store_true', 'help': 'Reset and cleanup previous analysis'}),
+    
+    # Testing
+    (('-T', '--test'), {'action': 'store_true', 'help': 'Test mode'}),
+    
+    # Database update
+    (('-U', '--update-db'), {'action': 'store_true', 'help': 'Update vulnerability databases'}),
+    
+    # Vendor/Version
+    (('--vendor',), {'help': 'Firmware vendor'}),
+    (('-V', '--version'), {'help': 'Firmware version'}),
+    
+    # Web report
+    (('-W', '--web-report'), {'action': 'store_true', 'help': 'Generate web-based report'}),
+    
+    # YARA
+    (('-y', '--yara'), {'action': 'store_true', 'help': 'Enable YARA scanning'}),
+    
+    # ZIP
+    (('-z', '--zip'), {'action': 'store_true', 'help': 'Create ZIP archive of results'}),
+    
+    # Zap
+    (('-Z', '--zap'), {'action': 'store_true', 'help': 'Enable ZAP security testing'}),
+    
+    # XSS
+    (('-X', '--xss'), {'action': 'store_true', 'help': 'Enable XSS testing'}),
+    
+    # Verbosity
+    (('-v', '--verbose'), {'action': 'store_true', 'help': 'Verbose output'}),
+    (('--debug',), {'action': 'store_true', 'help': 'Debug mode'}),
+    
+    # Short paths
+    (('-s', '--short-path'), {'action': 'store_true', 'help': 'Use short paths in output'}),
+    
+    # Disable features
+    (('-B', '--no-status-bar'), {'action': 'store_true', 'help': 'Disable status bar'}),
+    (('--no-notifications',), {'action': 'store_true', 'help': 'Disable notifications'}),
+    (('--disable-module-cache',), {'action': 'store_true',
+                                   'help': 'Always rediscover modules instead of using the cache'}),
+    (('--force-revalidate',), {'action': 'store_true',
+                               'help': 'Validate the configuration even if it is unchanged'}),
+    
+    # Help is automatically provided by argparse
+    
+    # Banner
+    (('-b', '--banner'), {'action': 'store_true', 'help': 'Show banner and exit'}),
+)
+
+
+def _argument_dest(flags) -> str:
+    """Get the attribute name argparse derives for the given flags."""
+    long_flags = [flag for flag in flags if flag.startswith('--')]
+    return (long_flags[0] if long_flags else flags[0]).lstrip('-').replace('-', '_')
+
+
+def _argument_default(kwargs: Dict[str, Any]) -> Any:
+    """Get the value argparse assigns when the flag is absent."""
+    if 'default' in kwargs:
+        return kwargs['default']
+    return False if kwargs.get('action') == 'store_true' else None
+
+
+def _argument_requested(flags, argv: List[str]) -> bool:
+    """Check whether argv may use any of the flags."""
+    for token in argv:
+        if token.startswith('--'):
+            # argparse also accepts unambiguous prefixes of long options
+            name = token.split('=', 1)[0]
+            if any(flag.startswith(name) for flag in flags if flag.startswith('--')):
+                return True
+        elif token.startswith('-'):
+            # Short options can be combined (-vq), match every character
+            if any('-' + char in flags for char in token[1:]):
+                return True
+    return False
+
+
 class ParameterParser:
     """Parses command-line parameters for Pymba."""
     
-    def __init__(self):
+    def __init__(self, argv: Optional[List[str]] = None):
+        # Arguments the parser will be used for, None registers every argument
+        self.argv = argv
         self.args = None
         self.parser = None
         
@@ -62,7 +197,9 @@ class ParameterParser:
             'json': 0,
             'csv': 0,
             'short_path': 0,
-            'disable_notifications': 0
+            'disable_notifications': 0,
+            'disable_module_cache': 0,
+            'force_revalidate': 0
         }
         
         self._setup_parser()
@@ -81,130 +218,20 @@ Examples:
             """
         )
         
-        # Core parameters
-        self.parser.add_argument('-f', '--firmware', 
-                               help='Firmware file or directory to analyze')
-        self.parser.add_argument('-l', '--log-dir', 
-                               help='Output directory for logs and reports')
-        
-        # Architecture
-        self.parser.add_argument('-a', '--arch', 
-                               help='Target architecture (e.g., mips, arm, x86)')
-        self.parser.add_argument('-A', '--arch-no-check', 
-                               help='Target architecture without verification')
-        
-        # Analysis options
-        self.parser.add_argument('-c', '--extended', action='store_true',
-                               help='Extended binary analysis')
-        self.parser.add_argument('-E', '--emulation', action='store_true',
-                               help='Enable system emulation')
-        self.parser.add_argument('-F', '--force', action='store_true',
-                               help='Force analysis even if issues detected')
-        self.parser.add_argument('-Q', '--quick', action='store_true',
-                               help='Quick analysis mode')
-        self.parser.add_argument('-q', '--quiet', action='store_true',
-                               help='Quiet mode (minimal output)')
-        
-        # Exclusions
-        self.parser.add_argument('-e', '--exclude', action='append',
-                               help='Exclude path from analysis (can be used multiple times)')
-        
-        # Kernel
-        self.parser.add_argument('-k', '--kernel',
-                               help='Kernel file for analysis')
-        
-        # Modules
-        self.parser.add_argument('-m', '--modules', action='append',
-                               help='Specific modules to run (can be used multiple times)')
-        
-        # Threading
-        self.parser.add_argument('-t', '--threads', type=int, default=1,
-                               help='Number of threads for parallel execution')
-        
-        # Profiles
-        self.parser.add_argument('-p', '--profile',
-                               help='Scan profile to use')
-        self.parser.add_argument('-P', '--scan-profile',
-                               help='Alternative scan profile parameter')
-        
-        # Output formats
-        self.parser.add_argument('-H', '--html', action='store_true',
-                               help='Generate HTML report')
-        self.parser.add_argument('-j', '--json', action='store_true',
-                               help='Generate JSON output')
-        self.parser.add_argument('-C', '--csv', action='store_true',
-                               help='Generate CSV output')
-        
-        # Docker options
-        self.parser.add_argument('-D', '--no-docker', action='store_true',
-                               help='Run without Docker (development mode)')
-        self.parser.add_argument('--container',
-                               help='Docker container ID for extraction')
-        
-        # Dependency check
-        self.parser.add_argument('-d', '--dep-check', type=int, choices=[1, 2],
-                               help='Dependency check mode (1=host+container, 2=container only)')
-        
-        # Reset and cleanup
-        self.parser.add_argument('-r', '--reset', action='store_true',
-                               help='Reset and cleanup previous analysis')
-        
-        # Testing
-        self.parser.add_argument('-T', '--test', action='store_true',
-                               help='Test mode')
-        
-        # Database update
-        self.parser.add_argument('-U', '--update-db', action='store_true',
-                               help='Update vulnerability databases')
-        
-        # Vendor/Version
-        self.parser.add_argument('--vendor',
-                               help='Firmware vendor')
-        self.parser.add_argument('-V', '--version',
-                               help='Firmware version')
-        
-        # Web report
-        self.parser.add_argument('-W', '--web-report', action='store_true',
-                               help='Generate web-based report')
-        
-        # YARA
-        self.parser.add_argument('-y', '--yara', action='store_true',
-                               help='Enable YARA scanning')
-        
-        # ZIP
-        self.parser.add_argument('-z', '--zip', action='store_true',
-                               help='Create ZIP archive of results')
-        
-        # Zap
-        self.parser.add_argument('-Z', '--zap', action='store_true',
-                               help='Enable ZAP security testing')
-        
-        # XSS
-        self.parser.add_argument('-X', '--xss', action='store_true',
-                               help='Enable XSS testing')
-        
-        # Verbosity
-        self.parser.add_argument('-v', '--verbose', action='store_true',
-                               help='Verbose output')
-        self.parser.add_argument('--debug', action='store_true',
-                               help='Debug mode')
-        
-        # Short paths
-        self.parser.add_argument('-s', '--short-path', action='store_true',
-                               help='Use short paths in output')
-        
-        # Disable features
-        self.parser.add_argument('-B', '--no-status-bar', action='store_true',
-                               help='Disable status bar')
-        self.parser.add_argument('--no-notifications', action='store_true',
-                               help='Disable notifications')
-        
-        # Help
-        # Help is automatically provided by argparse
-        
-        # Banner
-        self.parser.add_argument('-b', '--banner', action='store_true',
-                               help='Show banner and exit')
+        # Help prints every argument; otherwise only the ones on the command
+        # line are registered and the others just get their defaults
+        argv = self.argv
+        build_all = argv is None or _argument_requested(_HELP_FLAGS, argv)
+        defaults = {}
+        
+        for flags, kwargs in _ARGUMENTS:
+            if build_all or _argument_requested(flags, argv):
+                self.parser.add_argument(*flags, **kwargs)
+            else:
+                defaults[_argument_dest(flags)] = _argument_default(kwargs)
+        
+        if defaults:
+            self.parser.set_defaults(**defaults)
     
     def parse_args(self, args: Optional[List[str]] = None) -> argparse.Namespace:
         """Parse command-line arguments."""
@@ -325,6 +352,13 @@ Examples:
         if args_dict.get('exclude'):
             args_dict['exclude_paths'] = args_dict['exclude']
         
+        # -m may be repeated and each value may list several modules (-m S10,S20)
+        if args_dict.get('modules'):
+            args_dict['modules'] = [
+                module for value in args_dict['modules']
+                for module in _split_list(value.strip()) if module
+            ]
+        
         # Set log level based on verbosity
         if args_dict.get('debug'):
             args_dict['log_level'] = 3
@@ -341,7 +375,8 @@ Examples:
         """Print help message."""
         self.parser.print_help()
     
-    def print_banner(self):
+    @staticmethod
+    def print_banner():
         """Print Pymba banner."""
         banner = f"""
 {Colors.BOLD}╔═══════════════════════════════════════════════════════════════╗{Colors.NC}
@@ -367,13 +402,13 @@ Examples:
 
 def parse_parameters(args: Optional[List[str]] = None) -> Dict[str, Any]:
     """Convenience function to parse parameters."""
-    parser = ParameterParser()
-    
-    # Handle banner request
+    # Handle banner request before any argument is registered
     if args and '-b' in args:
-        parser.print_banner()
+        ParameterParser.print_banner()
         sys.exit(0)
     
+    parser = ParameterParser(sys.argv[1:] if args is None else args)
+    
     parsed_args = parser.parse_args(args)
     
     if not parser.validate_args():
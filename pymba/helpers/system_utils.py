@@ -13,6 +13,8 @@ import platform
 import multiprocessing
 import psutil
 import shutil
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple, Union
 
 
@@ -57,14 +59,20 @@ def run_command(command: Union[str, List[str]],
         return -1, "", str(e)
 
 
+@functools.lru_cache(maxsize=None)
 def check_command_exists(command: str) -> bool:
-    """Check if command exists in PATH."""
+    """Check if command exists in PATH (cached, see refresh_path_cache())."""
     try:
         return shutil.which(command) is not None
     except Exception:
         return False
 
 
+def refresh_path_cache():
+    """Forget cached PATH lookups, e.g. after installing a tool."""
+    check_command_exists.cache_clear()
+
+
 def _pip_install(package_name: str) -> Tuple[int, str, str]:
     """Attempt to install a Python package into the current interpreter env."""
     try:
@@ -88,15 +96,25 @@ def ensure_tools(tools: List[str]) -> Dict[str, bool]:
         'unblob': 'unblob',
     }
 
+    # PATH probes are independent, run them concurrently
+    if len(tools) > 1:
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            found = list(executor.map(check_command_exists, tools))
+    else:
+        found = [check_command_exists(tool) for tool in tools]
+
     results: Dict[str, bool] = {}
-    for tool in tools:
-        if check_command_exists(tool):
+    for tool, exists in zip(tools, found):
+        if exists:
             results[tool] = True
             continue
 
+        # Installs stay sequential, concurrent pip runs can corrupt the env
         pkg = tool_to_pip.get(tool)
         if pkg:
             code, _, _ = _pip_install(pkg)
+            if code == 0:
+                refresh_path_cache()
             # Re-check PATH; some console scripts are added to the venv bin
             available = (code == 0) and check_command_exists(tool)
             results[tool] = available
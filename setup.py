@@ -32,9 +32,12 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "perf": ["fastrlock>=0.8", "orjson>=3.0"],
+    },
     entry_points={
         "console_scripts": [
-            "pymba=pymba.cli:main",
+            "pymba=pymba.cli.main:main",
         ],
     },
     include_package_data=True,
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test script for the Pymba module scheduler.
+
+This script registers stub modules with a dependency chain, a dependency
+cycle and a failing producer, and checks the computed levels, the result
+statuses and the execution summary.
+"""
+
+import os
+import sys
+import tempfile
+
+# Add pymba to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'pymba'))
+
+from pymba.core.config import PymbaConfig
+from pymba.core.logger import PymbaLogger
+from pymba.core.module_manager import (
+    ModuleCategory, ModuleInfo, ModuleManager, ModuleStatus
+)
+
+
+class StubModule:
+    """Module that succeeds without doing anything."""
+
+    def __init__(self, config, log_manager):
+        pass
+
+    def run(self, **kwargs):
+        return 0
+
+
+class FailingModule(StubModule):
+    """Module that raises before it can return an exit code."""
+
+    def run(self, **kwargs):
+        raise RuntimeError("producer failed")
+
+
+def register(manager, name, module_class, dependencies, priority):
+    """Register a stub module in the S category."""
+    info = ModuleInfo(
+        name=name,
+        category=ModuleCategory.S,
+        priority=priority,
+        dependencies=dependencies,
+        can_run_parallel=True,
+        max_threads=1,
+        timeout=None,
+        enabled=True,
+        description=f"Stub module {name}"
+    )
+    manager.register_module(name, module_class, info)
+
+
+def check(label, actual, expected):
+    """Print a check result and return whether it passed."""
+    ok = actual == expected
+    print(f"  [{'OK' if ok else 'FAIL'}] {label}: {actual}")
+    if not ok:
+        print(f"         expected: {expected}")
+    return ok
+
+
+def main():
+    """Main test function."""
+    print("Pymba Module Scheduler Test")
+    print("===========================")
+    
+    log_dir = tempfile.mkdtemp(prefix="pymba_test_")
+    
+    config = PymbaConfig()
+    config.log_dir = log_dir
+    
+    manager = ModuleManager(PymbaLogger(log_dir), config)
+    
+    # S01 fails, so S02 and S03 further down its chain are skipped. S04 is
+    # independent, S05 and S06 depend on each other.
+    register(manager, "S01_producer", FailingModule, [], 1)
+    register(manager, "S02_consumer", StubModule, ["S01_producer"], 2)
+    register(manager, "S03_report", StubModule, ["S02_consumer"], 3)
+    register(manager, "S04_independent", StubModule, [], 4)
+    register(manager, "S05_cycle_a", StubModule, ["S06_cycle_b"], 5)
+    register(manager, "S06_cycle_b", StubModule, ["S05_cycle_a"], 6)
+    
+    passed = True
+    
+    print("\nDependency levels:")
+    levels = manager._compute_levels(["S01_producer", "S02_consumer", "S03_report", "S04_independent"])
+    passed &= check("levels", [sorted(level) for level in levels],
+                    [["S01_producer", "S04_independent"], ["S02_consumer"], ["S03_report"]])
+    
+    print("\nGroup run:")
+    exit_codes = manager.run_module_group("S")
+    passed &= check("exit codes", exit_codes, [1, 1, 1, 0, 1, 1])
+    
+    statuses = {name: result.status for name, result in manager.module_results.items()}
+    passed &= check("statuses", dict(sorted(statuses.items())), {
+        "S01_producer": ModuleStatus.FAILED,
+        "S02_consumer": ModuleStatus.SKIPPED,
+        "S03_report": ModuleStatus.SKIPPED,
+        "S04_independent": ModuleStatus.COMPLETED,
+        "S05_cycle_a": ModuleStatus.FAILED,
+        "S06_cycle_b": ModuleStatus.FAILED,
+    })
+    
+    print("\nExecution summary:")
+    summary = manager.get_execution_summary()
+    passed &= check("counts", {key: summary[key] for key in ("total", "completed", "failed", "skipped")},
+                    {"total": 6, "completed": 1, "failed": 3, "skipped": 2})
+    
+    # Cleanup
+    import shutil
+    shutil.rmtree(log_dir, ignore_errors=True)
+    
+    print("\nAll checks passed!" if passed else "\nSome checks failed!")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())